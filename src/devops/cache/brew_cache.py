@@ -5,7 +5,7 @@ import subprocess
 import time
 from pathlib import Path
 from threading import Thread
-from typing import Callable
+from typing import Callable, Iterable
 
 
 class BrewInfoCache:
@@ -72,14 +72,14 @@ class BrewInfoCache:
 
     def load_all_in_background(
         self,
-        package_names: list[str],
+        package_names: Iterable[str],
         on_progress: Callable[[str, int, int], None] | None = None,
         on_complete: Callable[[], None] | None = None,
     ) -> None:
         """Load brew info for all packages in background thread.
 
         Args:
-            package_names: List of package names to load
+            package_names: Package names to load (consumed once)
             on_progress: Callback(package_name, current, total) for progress updates
             on_complete: Callback when all loading is complete
         """
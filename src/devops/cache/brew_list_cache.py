@@ -5,6 +5,7 @@ import json
 from dataclasses import asdict, dataclass
 from enum import Enum
 from pathlib import Path
+from typing import Iterable
 
 
 class CacheKey(Enum):
@@ -83,6 +84,16 @@ class BrewListCache:
                 return entry.data
         return None
 
+    def get_many(self, keys: list[CacheKey]) -> dict[CacheKey, list[dict] | None]:
+        """Get several cached entries, checking the brew state only once."""
+        current_hash = self._get_brew_prefix_hash()
+        result = {}
+        for key in keys:
+            entry = self._cache.get(key.value)
+            valid = entry is not None and entry.brew_prefix_hash == current_hash
+            result[key] = entry.data if valid else None
+        return result
+
     def set(self, key: CacheKey, data: list[dict]) -> None:
         """Cache data with current brew state."""
         self._cache[key.value] = CacheEntry(
@@ -91,6 +102,16 @@ class BrewListCache:
         self._dirty = True
         self._save_to_disk()
 
+    def set_many(self, items: dict[CacheKey, list[dict]]) -> None:
+        """Cache several entries with one brew state check and one disk write."""
+        current_hash = self._get_brew_prefix_hash()
+        for key, data in items.items():
+            self._cache[key.value] = CacheEntry(
+                data=data, brew_prefix_hash=current_hash
+            )
+        self._dirty = True
+        self._save_to_disk()
+
     def invalidate(self, key: CacheKey) -> None:
         """Invalidate a specific cache entry."""
         if key.value in self._cache:
@@ -116,13 +137,21 @@ class BrewListCache:
 
     def invalidate_for_upgrade(self, package_name: str) -> None:
         """Invalidate caches affected by upgrading a package."""
+        self.invalidate_for_upgrades([package_name])
+
+    def invalidate_for_upgrades(self, package_names: Iterable[str]) -> None:
+        """Invalidate caches affected by upgrading several packages at once."""
         self.invalidate(CacheKey.OUTDATED)
-        # Also invalidate the package info cache
+        # Also invalidate the package info cache, saving it once for the batch
         from devops.cache.brew_cache import get_brew_cache
 
         brew_cache = get_brew_cache()
-        if package_name in brew_cache._cache:
-            del brew_cache._cache[package_name]
+        removed = False
+        for name in package_names:
+            if name in brew_cache._cache:
+                del brew_cache._cache[name]
+                removed = True
+        if removed:
             brew_cache._save_to_disk()
 
 
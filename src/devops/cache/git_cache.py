@@ -49,6 +49,12 @@ def load_scan_dirs() -> list[str]:
     return _load_cache_data().get("scan_dirs", [])
 
 
+def load_git_config() -> tuple[list[str], list[str]]:
+    """Load cached repository paths and scan directories in one read."""
+    data = _load_cache_data()
+    return data["repos"], data["scan_dirs"]
+
+
 def save_repos(repos: list[str]) -> None:
     """Save repository paths to cache."""
     data = _load_cache_data()
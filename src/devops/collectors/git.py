@@ -2,11 +2,13 @@
 
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from devops.cache.git_cache import load_cached_repos
 
 from .base import BaseCollector, EnvEntry, Status
+from .git_async import MAX_STATUS_WORKERS
 
 # Directories to skip when scanning for git repos
 SKIP_DIRECTORIES = {
@@ -141,13 +143,11 @@ class GitCollector(BaseCollector):
             # Return empty list - MainScreen will show setup UI
             return []
 
-        entries = []
-        for repo_path in repos:
-            entry = self._get_repo_status(repo_path)
-            if entry:
-                entries.append(entry)
-
-        return entries
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_STATUS_WORKERS, len(repos))
+        ) as pool:
+            statuses = pool.map(self._get_repo_status, repos)
+            return [entry for entry in statuses if entry]
 
     def _get_repo_status(self, path: str) -> EnvEntry | None:
         """Get status for a single repository."""
@@ -1,12 +1,16 @@
 """Async-compatible Git collector for use with Textual workers."""
 
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
 from devops.cache.git_cache import load_cached_repos
 from devops.collectors.base import EnvEntry, Status
 
+# Repos whose git subprocesses run concurrently
+MAX_STATUS_WORKERS = 16
+
 
 @dataclass
 class GitCollectResult:
@@ -166,10 +170,8 @@ def collect_git_sync() -> GitCollectResult:
     if not repos:
         return GitCollectResult(entries=[], repo_count=0)
 
-    entries = []
-    for repo_path in repos:
-        entry = _get_repo_status(repo_path)
-        if entry:
-            entries.append(entry)
+    # Each repo spends its time waiting on git, so check them concurrently
+    with ThreadPoolExecutor(max_workers=min(MAX_STATUS_WORKERS, len(repos))) as pool:
+        entries = [entry for entry in pool.map(_get_repo_status, repos) if entry]
 
     return GitCollectResult(entries=entries, repo_count=len(repos))
@@ -1,5 +1,6 @@
 """Async-compatible Homebrew collector for use with Textual workers."""
 
+import asyncio
 import json
 import subprocess
 from dataclasses import dataclass
@@ -18,6 +19,35 @@ class BrewCollectResult:
     from_cache: bool = False
 
 
+def _parse_formulae_json(stdout: str) -> list[dict]:
+    """Parse `brew list --formula --json=v2` output."""
+    data = json.loads(stdout)
+    formulae = []
+    for f in data.get("formulae", []):
+        formulae.append(
+            {
+                "name": f.get("name", ""),
+                "version": (
+                    f.get("installed", [{}])[0].get("version", "")
+                    if f.get("installed")
+                    else ""
+                ),
+                "desc": f.get("desc", ""),
+                "homepage": f.get("homepage", ""),
+            }
+        )
+    return sorted(formulae, key=lambda x: x["name"])
+
+
+def _parse_name_list(stdout: str, desc: str) -> list[dict]:
+    """Parse one-name-per-line `brew list` output."""
+    return [
+        {"name": p.strip(), "version": "", "desc": desc}
+        for p in stdout.strip().split("\n")
+        if p.strip()
+    ]
+
+
 def collect_formulae_sync() -> list[dict]:
     """Synchronously collect formulae list."""
     try:
@@ -28,22 +58,7 @@ def collect_formulae_sync() -> list[dict]:
             timeout=30,
         )
         if result.returncode == 0:
-            data = json.loads(result.stdout)
-            formulae = []
-            for f in data.get("formulae", []):
-                formulae.append(
-                    {
-                        "name": f.get("name", ""),
-                        "version": (
-                            f.get("installed", [{}])[0].get("version", "")
-                            if f.get("installed")
-                            else ""
-                        ),
-                        "desc": f.get("desc", ""),
-                        "homepage": f.get("homepage", ""),
-                    }
-                )
-            return sorted(formulae, key=lambda x: x["name"])
+            return _parse_formulae_json(result.stdout)
     except Exception:
         pass
 
@@ -56,11 +71,7 @@ def collect_formulae_sync() -> list[dict]:
             timeout=10,
         )
         if result.returncode == 0:
-            return [
-                {"name": p.strip(), "version": "", "desc": ""}
-                for p in result.stdout.strip().split("\n")
-                if p.strip()
-            ]
+            return _parse_name_list(result.stdout, "")
     except Exception:
         pass
     return []
@@ -76,16 +87,39 @@ def collect_casks_sync() -> list[dict]:
             timeout=10,
         )
         if result.returncode == 0:
-            return [
-                {"name": p.strip(), "version": "", "desc": "GUI Application"}
-                for p in result.stdout.strip().split("\n")
-                if p.strip()
-            ]
+            return _parse_name_list(result.stdout, "GUI Application")
     except Exception:
         pass
     return []
 
 
+def _parse_outdated_json(stdout: str) -> list[dict]:
+    """Parse `brew outdated --json=v2` output."""
+    data = json.loads(stdout)
+    outdated = []
+    for f in data.get("formulae", []):
+        outdated.append(
+            {
+                "name": f.get("name", ""),
+                "current": (
+                    f.get("installed_versions", [""])[0]
+                    if f.get("installed_versions")
+                    else ""
+                ),
+                "latest": f.get("current_version", ""),
+            }
+        )
+    for c in data.get("casks", []):
+        outdated.append(
+            {
+                "name": c.get("name", ""),
+                "current": c.get("installed_versions", ""),
+                "latest": c.get("current_version", ""),
+            }
+        )
+    return outdated
+
+
 def collect_outdated_sync() -> list[dict]:
     """Synchronously collect outdated packages."""
     try:
@@ -96,29 +130,7 @@ def collect_outdated_sync() -> list[dict]:
             timeout=30,
         )
         if result.returncode == 0:
-            data = json.loads(result.stdout)
-            outdated = []
-            for f in data.get("formulae", []):
-                outdated.append(
-                    {
-                        "name": f.get("name", ""),
-                        "current": (
-                            f.get("installed_versions", [""])[0]
-                            if f.get("installed_versions")
-                            else ""
-                        ),
-                        "latest": f.get("current_version", ""),
-                    }
-                )
-            for c in data.get("casks", []):
-                outdated.append(
-                    {
-                        "name": c.get("name", ""),
-                        "current": c.get("installed_versions", ""),
-                        "latest": c.get("current_version", ""),
-                    }
-                )
-            return outdated
+            return _parse_outdated_json(result.stdout)
     except Exception:
         pass
     return []
@@ -133,9 +145,10 @@ def collect_all_sync(use_cache: bool = True) -> BrewCollectResult:
 
     # Try cache first
     if use_cache:
-        cached_formulae = cache.get(CacheKey.FORMULAE)
-        cached_casks = cache.get(CacheKey.CASKS)
-        cached_outdated = cache.get(CacheKey.OUTDATED)
+        cached = cache.get_many([CacheKey.FORMULAE, CacheKey.CASKS, CacheKey.OUTDATED])
+        cached_formulae = cached[CacheKey.FORMULAE]
+        cached_casks = cached[CacheKey.CASKS]
+        cached_outdated = cached[CacheKey.OUTDATED]
 
         if cached_formulae is not None and cached_casks is not None:
             return BrewCollectResult(
@@ -151,9 +164,97 @@ def collect_all_sync(use_cache: bool = True) -> BrewCollectResult:
     outdated = collect_outdated_sync()
 
     # Update cache
-    cache.set(CacheKey.FORMULAE, formulae)
-    cache.set(CacheKey.CASKS, casks)
-    cache.set(CacheKey.OUTDATED, outdated)
+    cache.set_many(
+        {
+            CacheKey.FORMULAE: formulae,
+            CacheKey.CASKS: casks,
+            CacheKey.OUTDATED: outdated,
+        }
+    )
+
+    return BrewCollectResult(
+        formulae=formulae,
+        casks=casks,
+        outdated=outdated,
+        from_cache=False,
+    )
+
+
+async def _run_brew_async(args: list[str], timeout: float) -> str | None:
+    """Run a brew command without blocking the event loop.
+
+    Returns stdout on success, or None on failure or timeout.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "brew",
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except OSError:
+        return None
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return None
+    if proc.returncode != 0:
+        return None
+    return stdout.decode("utf-8", errors="replace")
+
+
+async def collect_formulae_async() -> list[dict]:
+    """Collect formulae list without blocking the event loop."""
+    stdout = await _run_brew_async(["list", "--formula", "--json=v2"], 30)
+    if stdout is not None:
+        try:
+            return _parse_formulae_json(stdout)
+        except Exception:
+            pass
+
+    # Fallback to simple list
+    stdout = await _run_brew_async(["list", "--formula"], 10)
+    return _parse_name_list(stdout, "") if stdout is not None else []
+
+
+async def collect_casks_async() -> list[dict]:
+    """Collect casks list without blocking the event loop."""
+    stdout = await _run_brew_async(["list", "--cask"], 10)
+    return _parse_name_list(stdout, "GUI Application") if stdout is not None else []
+
+
+async def collect_outdated_async() -> list[dict]:
+    """Collect outdated packages without blocking the event loop."""
+    stdout = await _run_brew_async(["outdated", "--json=v2"], 30)
+    if stdout is not None:
+        try:
+            return _parse_outdated_json(stdout)
+        except Exception:
+            pass
+    return []
+
+
+async def collect_all_async() -> BrewCollectResult:
+    """Collect fresh brew data, running the three brew commands concurrently.
+
+    This is designed to be awaited from a Textual async worker; wall time is
+    that of the slowest command rather than the sum of all three.
+    """
+    formulae, casks, outdated = await asyncio.gather(
+        collect_formulae_async(), collect_casks_async(), collect_outdated_async()
+    )
+
+    # Writing the cache file is blocking disk I/O, so keep it off the loop
+    await asyncio.to_thread(
+        get_brew_list_cache().set_many,
+        {
+            CacheKey.FORMULAE: formulae,
+            CacheKey.CASKS: casks,
+            CacheKey.OUTDATED: outdated,
+        },
+    )
 
     return BrewCollectResult(
         formulae=formulae,
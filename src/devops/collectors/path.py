@@ -98,13 +98,12 @@ class PathCollector(BaseCollector):
             all_executables = []
             if exists and is_dir:
                 try:
-                    execs = sorted(
-                        [
+                    with os.scandir(path_dir) as it:
+                        execs = sorted(
                             f.name
-                            for f in path_obj.iterdir()
-                            if f.is_file() and os.access(f, os.X_OK)
-                        ]
-                    )
+                            for f in it
+                            if f.is_file() and os.access(f.path, os.X_OK)
+                        )
                     exec_count = len(execs)
                     all_executables = execs
                 except PermissionError:
@@ -6,6 +6,22 @@ from pathlib import Path
 
 from devops.collectors.base import BaseCollector, EnvEntry, Status
 
+# Binaries in $CARGO_HOME/bin that rustup installs (not user crates)
+_RUSTUP_MANAGED = frozenset(
+    {
+        "rustup",
+        "cargo",
+        "rustc",
+        "rustfmt",
+        "clippy-driver",
+        "cargo-fmt",
+        "cargo-clippy",
+        "rust-gdb",
+        "rust-lldb",
+        "rustdoc",
+    }
+)
+
 
 class RustCollector(BaseCollector):
     """Collects Rust toolchains from rustup."""
@@ -107,18 +123,7 @@ class RustCollector(BaseCollector):
             for binary in bin_dir.iterdir():
                 if binary.is_file() and not binary.name.startswith("."):
                     # Skip rustup-managed binaries
-                    if binary.name in [
-                        "rustup",
-                        "cargo",
-                        "rustc",
-                        "rustfmt",
-                        "clippy-driver",
-                        "cargo-fmt",
-                        "cargo-clippy",
-                        "rust-gdb",
-                        "rust-lldb",
-                        "rustdoc",
-                    ]:
+                    if binary.name in _RUSTUP_MANAGED:
                         continue
                     crates.append(
                         {
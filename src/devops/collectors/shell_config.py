@@ -1,7 +1,7 @@
 import os
 import re
+from collections import defaultdict
 from dataclasses import dataclass
-from pathlib import Path
 
 from devops.collectors.base import BaseCollector, EnvEntry, Status
 
@@ -49,53 +49,87 @@ class ShellConfigCollector(BaseCollector):
 
         for config_path, description in self.CONFIG_FILES:
             expanded = os.path.expanduser(config_path)
-            path_obj = Path(expanded)
 
-            if not path_obj.exists():
+            # One stat answers both "does it exist" and "how big is it"
+            try:
+                st = os.stat(expanded)
+            except FileNotFoundError:
                 continue
 
             load_order += 1  # Only increment for files that exist
 
             try:
-                content = path_obj.read_text()
-                line_count = len(content.splitlines())
-                size = path_obj.stat().st_size
-
-                items = self._parse_config(content)
-
-                grouped = {}
-                for item in items:
-                    if item.item_type not in grouped:
-                        grouped[item.item_type] = []
-                    grouped[item.item_type].append(item)
-
-                entry = EnvEntry(
-                    name=config_path,
-                    path=expanded,
-                    status=Status.HEALTHY,
-                    details={
-                        "load_order": load_order,
-                        "description": description,
-                        "line_count": line_count,
-                        "size_bytes": size,
-                        "items": grouped,
-                        "item_counts": {k: len(v) for k, v in grouped.items()},
-                    },
+                entries.append(
+                    self._collect_file(config_path, description, st, load_order)
                 )
-                entries.append(entry)
-
-            except (PermissionError, UnicodeDecodeError) as e:
+            except PermissionError as e:
                 load_order += 1
-                entry = EnvEntry(
-                    name=config_path,
-                    path=expanded,
-                    status=Status.ERROR,
-                    details={"error": str(e), "load_order": load_order},
-                )
-                entries.append(entry)
+                entries.append(self._error_entry(config_path, e, load_order))
 
         return entries
 
+    def recollect_file(self, path: str, load_order: int) -> list[EnvEntry]:
+        """Re-read a single config file, keeping its existing load order.
+
+        Returns an empty list if the path is not a known config file or no
+        longer exists.
+        """
+        for config_path, description in self.CONFIG_FILES:
+            if os.path.expanduser(config_path) != path:
+                continue
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                return []
+            try:
+                return [self._collect_file(config_path, description, st, load_order)]
+            except PermissionError as e:
+                return [self._error_entry(config_path, e, load_order)]
+        return []
+
+    def _collect_file(
+        self, config_path: str, description: str, st: os.stat_result, load_order: int
+    ) -> EnvEntry:
+        """Read and parse one existing config file into its entry."""
+        expanded = os.path.expanduser(config_path)
+        with open(expanded, "rb") as fh:
+            raw = fh.read()
+        content = raw.decode("utf-8", errors="replace")
+        line_count = len(content.splitlines())
+
+        items = self._parse_config(content)
+
+        grouped = defaultdict(list)
+        counts = defaultdict(int)
+        for item in items:
+            grouped[item.item_type].append(item)
+            counts[item.item_type] += 1
+
+        return EnvEntry(
+            name=config_path,
+            path=expanded,
+            status=Status.HEALTHY,
+            details={
+                "load_order": load_order,
+                "description": description,
+                "line_count": line_count,
+                "size_bytes": st.st_size,
+                "items": dict(grouped),
+                "item_counts": dict(counts),
+            },
+        )
+
+    def _error_entry(
+        self, config_path: str, error: Exception, load_order: int
+    ) -> EnvEntry:
+        """Entry for a config file that exists but could not be read."""
+        return EnvEntry(
+            name=config_path,
+            path=os.path.expanduser(config_path),
+            status=Status.ERROR,
+            details={"error": str(error), "load_order": load_order},
+        )
+
     def _parse_config(self, content: str) -> list[ConfigItem]:
         """Parse config file and extract items."""
         items = []
@@ -104,12 +138,20 @@ class ShellConfigCollector(BaseCollector):
 
         while i < len(lines):
             line = lines[i]
-            line_num = i + 1
-            stripped = line.strip()
 
-            if not stripped or stripped.startswith("#"):
+            # Most lines are blank or comments - skip them before paying
+            # for a stripped copy of the line
+            if not line or line[0] == "#":
                 i += 1
                 continue
+            if line[0].isspace():
+                first = next((c for c in line if not c.isspace()), "")
+                if not first or first == "#":
+                    i += 1
+                    continue
+
+            line_num = i + 1
+            stripped = line.strip()
 
             # Check for function definitions - capture full body
             func_match = re.match(self.PATTERNS["function"], stripped)
@@ -1,5 +1,4 @@
 import os
-from pathlib import Path
 
 from devops.collectors.base import BaseCollector, EnvEntry, Status
 
@@ -18,37 +17,61 @@ class SymlinkCollector(BaseCollector):
         "~/.local/bin",
     ]
 
+    # Healthy symlinks listed per directory (broken ones are always listed)
+    MAX_HEALTHY_LISTED = 100
+
     def collect(self) -> list[EnvEntry]:
         """Collect symlink information."""
         entries = []
+        # Bind mounts and symlinked bin dirs resolve to the same directory;
+        # key on (device, inode) so each physical directory is walked once
+        seen_devinode: set[tuple[int, int]] = set()
 
         for dir_path in self.SCAN_DIRS:
             expanded = os.path.expanduser(dir_path)
-            path_obj = Path(expanded)
 
-            if not path_obj.exists():
+            try:
+                st = os.stat(expanded)
+            except OSError:
+                continue
+            key = (st.st_dev, st.st_ino)
+            if key in seen_devinode:
                 continue
+            seen_devinode.add(key)
 
             symlinks = []
             broken = []
+            healthy = 0
 
             try:
-                for item in path_obj.iterdir():
-                    if item.is_symlink():
-                        target = None
-                        is_broken = False
+                # scandir reports the entry type from the directory listing,
+                # so non-links cost no extra syscall
+                with os.scandir(expanded) as it:
+                    for item in it:
+                        if not item.is_symlink():
+                            continue
+                        # stat() follows the link; failing means it dangles
                         try:
-                            target = str(item.resolve())
-                            if not Path(target).exists():
-                                is_broken = True
-                        except:
+                            item.stat()
+                            is_broken = False
+                        except OSError:
                             is_broken = True
 
+                        if not is_broken:
+                            healthy += 1
+                            if len(symlinks) >= self.MAX_HEALTHY_LISTED:
+                                continue
+
+                        try:
+                            target = os.path.realpath(item.path)
+                        except OSError:
+                            target = None
+
                         link_info = {
                             "name": item.name,
                             "target": target or "(broken)",
                             "broken": is_broken,
-                            "full_path": str(item),
+                            "full_path": item.path,
                         }
 
                         if is_broken:
@@ -58,7 +81,7 @@ class SymlinkCollector(BaseCollector):
             except PermissionError:
                 continue
 
-            if symlinks or broken:
+            if healthy or broken:
                 status = Status.WARNING if broken else Status.HEALTHY
                 entries.append(
                     EnvEntry(
@@ -66,10 +89,10 @@ class SymlinkCollector(BaseCollector):
                         path=expanded,
                         status=status,
                         details={
-                            "total_symlinks": len(symlinks) + len(broken),
-                            "healthy": len(symlinks),
+                            "total_symlinks": healthy + len(broken),
+                            "healthy": healthy,
                             "broken": len(broken),
-                            "symlinks": symlinks[:100],  # Limit for performance
+                            "symlinks": symlinks,
                             "broken_links": broken,
                         },
                     )
@@ -1,5 +1,6 @@
 import subprocess
 import os
+import shutil
 from pathlib import Path
 
 from devops.collectors.base import BaseCollector, EnvEntry, Status
@@ -83,17 +84,24 @@ class VersionManagerCollector(BaseCollector):
                 versions = [v.name for v in versions_dir.iterdir() if v.is_dir()]
 
             # Get current version
+            # subprocess only takes its posix_spawn fast path (no fork of
+            # this process) when close_fds=False and the executable is given
+            # as a path; we hold no fds the child could misuse, so the
+            # inherited descriptors are an acceptable trade-off here.
             current = ""
-            try:
-                result = subprocess.run(
-                    ["node", "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                current = result.stdout.strip()
-            except:
-                pass
+            node = shutil.which("node")
+            if node:
+                try:
+                    result = subprocess.run(
+                        [node, "--version"],
+                        capture_output=True,
+                        text=True,
+                        timeout=5,
+                        close_fds=False,
+                    )
+                    current = result.stdout.strip()
+                except:
+                    pass
 
             return EnvEntry(
                 name="nvm (Node Version Manager)",
@@ -1,17 +1,166 @@
 """FFmpeg command builder screen."""
 
+import asyncio
 import os
 import shutil
-import subprocess
+import signal
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple
 
+import pyperclip
+from textual import work
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.widget import Widget
 from textual.widgets import Button, Checkbox, Input, Select, Static, TextArea
+from textual.worker import Worker
 
+from devops.screens.process_output import OutputLines
 from devops.widgets.path_input import PathInput
 
+# Resolved once per process rather than on every screen construction
+_FFMPEG_PATH = shutil.which("ffmpeg")
+
+# Codec arguments per output format; formats not listed use ffmpeg's defaults
+_AUDIO_CODEC_ARGS = {
+    "mp3": ("-c:a", "libmp3lame"),
+    "aac": ("-c:a", "aac"),
+    "wav": ("-c:a", "pcm_s16le"),
+    "flac": ("-c:a", "flac"),
+    "ogg": ("-c:a", "libvorbis"),
+}
+# Lossy audio formats that take the selected bitrate
+_BITRATE_AUDIO_FORMATS = frozenset({"mp3", "aac", "ogg"})
+_VIDEO_CODEC_ARGS = {
+    "mp4": ("-c:v", "libx264", "-c:a", "aac"),
+    "webm": ("-c:v", "libvpx-vp9", "-c:a", "libopus"),
+    "mov": ("-c:v", "libx264", "-c:a", "aac"),
+}
+
+
+class _PreviewState(NamedTuple):
+    """Every form value the command preview depends on."""
+
+    input_file: str
+    output_file: str
+    convert: bool
+    compress: bool
+    resize: bool
+    trim: bool
+    audio: bool
+    noaudio: bool
+    output_format: str
+    quality: str
+    speed: str
+    resolution: str
+    custom_res: str
+    start_time: str
+    duration: str
+    audio_format: str
+    audio_quality: str
+
+
+@lru_cache(maxsize=64)
+def _build_cmd(state: _PreviewState) -> tuple[str, ...]:
+    """Build the FFmpeg argv for a form state."""
+    cmd = ["ffmpeg", "-y"]  # -y to overwrite
+    inp = state.input_file.strip()
+    inp = os.path.expanduser(inp) if inp else ""
+    # Output defaults derive from the input name; split it once
+    base, ext = os.path.splitext(inp)
+
+    # Trim - start time before input for fast seeking
+    if state.trim:
+        start = state.start_time.strip()
+        if start:
+            cmd.extend(["-ss", start])
+
+    # Input
+    if inp:
+        cmd.extend(["-i", inp])
+
+    # Duration after input
+    if state.trim:
+        dur = state.duration.strip()
+        if dur:
+            cmd.extend(["-t", dur])
+
+    # Audio extraction mode
+    if state.audio:
+        cmd.append("-vn")  # No video
+        fmt = state.audio_format
+        qual = state.audio_quality
+
+        cmd.extend(_AUDIO_CODEC_ARGS.get(fmt, ()))
+        if fmt in _BITRATE_AUDIO_FORMATS:
+            cmd.extend(["-b:a", qual])
+
+        # Output
+        out = state.output_file.strip()
+        out = os.path.expanduser(out) if out else ""
+        if not out and inp:
+            out = f"{base}.{fmt}"
+        if out:
+            cmd.append(out)
+    else:
+        # Video processing - preserve input format unless converting
+        if state.convert:
+            out_fmt = state.output_format
+            cmd.extend(_VIDEO_CODEC_ARGS.get(out_fmt, ()))
+        else:
+            # Keep original format
+            out_fmt = ext.lstrip(".").lower() or "mp4"
+
+        # Compression
+        if state.compress:
+            crf = state.quality
+            speed = state.speed
+            cmd.extend(["-crf", crf, "-preset", speed])
+
+        # Resize
+        if state.resize:
+            res = state.resolution
+            if res == "custom":
+                custom = state.custom_res.strip()
+                if custom:
+                    cmd.extend(["-vf", f"scale={custom}"])
+            else:
+                cmd.extend(["-vf", f"scale={res}"])
+
+        # Remove audio
+        if state.noaudio:
+            cmd.append("-an")
+
+        # Output
+        out = state.output_file.strip()
+        out = os.path.expanduser(out) if out else ""
+        if not out and inp:
+            suffix = "_output"
+            if state.compress:
+                suffix = "_compressed"
+            elif state.resize:
+                suffix = "_resized"
+            elif state.trim:
+                suffix = "_trimmed"
+            out = f"{base}{suffix}.{out_fmt}"
+        if out:
+            cmd.append(out)
+
+    return tuple(cmd)
+
+
+@lru_cache(maxsize=64)
+def _format_cmd(cmd: tuple[str, ...]) -> str:
+    """Format an argv for the preview, one option per line when long."""
+    if len(cmd) <= 6:
+        return " ".join(cmd)
+    lines = [f"{a} {b}" for a, b in zip(cmd[2::2], cmd[3::2])]
+    if len(cmd) % 2:
+        lines.append(cmd[-1])
+    return f"{cmd[0]} {cmd[1]} \\\n  " + " \\\n  ".join(lines)
+
 
 class FFmpegScreen(Widget):
     """FFmpeg command builder interface."""
@@ -121,15 +270,16 @@ class FFmpegScreen(Widget):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._ffmpeg_installed: bool | None = None  # Lazy check
+        self._ffmpeg_installed = _FFMPEG_PATH is not None
+        self._installing = False
         self._current_command = ["ffmpeg"]
         self._process = None
-
-    def _check_ffmpeg_installed(self) -> bool:
-        """Lazy check for ffmpeg installation."""
-        if self._ffmpeg_installed is None:
-            self._ffmpeg_installed = shutil.which("ffmpeg") is not None
-        return self._ffmpeg_installed
+        self._preview_timer = None
+        self._widgets: dict[str, Widget] = {}
+        self._vis_pairs: list[tuple[Checkbox, Widget]] = []
+        self._last_snapshot: tuple | None = None
+        self._last_formatted: str | None = None
+        self._pending_lines: deque[str] = deque(maxlen=self._OUTPUT_TRIM_THRESHOLD)
 
     def compose(self) -> ComposeResult:
         with Horizontal(classes="ffmpeg-container"):
@@ -164,15 +314,10 @@ class FFmpegScreen(Widget):
                 with Vertical(id="convert-options", classes="options-group hidden"):
                     yield Static("Output format:")
                     yield Select(
-                        [
-                            (("MP4 (H.264)", "mp4")),
-                            (("WebM (VP9)", "webm")),
-                            (("MOV", "mov")),
-                            (("MKV", "mkv")),
-                            (("AVI", "avi")),
-                        ],
+                        self._FORMAT_OPTIONS,
                         id="output-format",
                         value="mp4",
+                        allow_blank=False,
                     )
 
                 yield Checkbox(
@@ -181,39 +326,27 @@ class FFmpegScreen(Widget):
                 with Vertical(id="compress-options", classes="options-group hidden"):
                     yield Static("Quality:")
                     yield Select(
-                        [
-                            (("High quality (CRF 18)", "18")),
-                            (("Good (CRF 23)", "23")),
-                            (("Medium (CRF 28)", "28")),
-                            (("Low/small (CRF 32)", "32")),
-                        ],
+                        self._QUALITY_OPTIONS,
                         id="quality",
                         value="23",
+                        allow_blank=False,
                     )
                     yield Static("Encoding speed:")
                     yield Select(
-                        [
-                            (("Fast", "fast")),
-                            (("Medium", "medium")),
-                            (("Slow (better)", "slow")),
-                        ],
+                        self._SPEED_OPTIONS,
                         id="speed",
                         value="medium",
+                        allow_blank=False,
                     )
 
                 yield Checkbox("Resize video", id="toggle-resize", classes="toggle-row")
                 with Vertical(id="resize-options", classes="options-group hidden"):
                     yield Static("Resolution:")
                     yield Select(
-                        [
-                            (("4K (3840p)", "3840:-2")),
-                            (("1080p", "1920:-2")),
-                            (("720p", "1280:-2")),
-                            (("480p", "854:-2")),
-                            (("Custom", "custom")),
-                        ],
+                        self._RESOLUTION_OPTIONS,
                         id="resolution",
                         value="1920:-2",
+                        allow_blank=False,
                     )
                     yield Input(placeholder="Custom: width:height", id="custom-res")
 
@@ -232,25 +365,17 @@ class FFmpegScreen(Widget):
                 with Vertical(id="audio-options", classes="options-group hidden"):
                     yield Static("Audio format:")
                     yield Select(
-                        [
-                            (("MP3", "mp3")),
-                            (("AAC", "aac")),
-                            (("WAV", "wav")),
-                            (("FLAC", "flac")),
-                            (("OGG", "ogg")),
-                        ],
+                        self._AUDIO_FORMAT_OPTIONS,
                         id="audio-format",
                         value="mp3",
+                        allow_blank=False,
                     )
                     yield Static("Audio quality:")
                     yield Select(
-                        [
-                            (("High (320k)", "320k")),
-                            (("Good (192k)", "192k")),
-                            (("Medium (128k)", "128k")),
-                        ],
+                        self._AUDIO_QUALITY_OPTIONS,
                         id="audio-quality",
                         value="192k",
+                        allow_blank=False,
                     )
 
                 yield Checkbox(
@@ -276,9 +401,124 @@ class FFmpegScreen(Widget):
                 yield Static("\nOutput", classes="section-header")
                 yield TextArea(id="output-area", read_only=True)
 
+    # Select options, built once rather than on every compose
+    _FORMAT_OPTIONS = (
+        ("MP4 (H.264)", "mp4"),
+        ("WebM (VP9)", "webm"),
+        ("MOV", "mov"),
+        ("MKV", "mkv"),
+        ("AVI", "avi"),
+    )
+    _QUALITY_OPTIONS = (
+        ("High quality (CRF 18)", "18"),
+        ("Good (CRF 23)", "23"),
+        ("Medium (CRF 28)", "28"),
+        ("Low/small (CRF 32)", "32"),
+    )
+    _SPEED_OPTIONS = (
+        ("Fast", "fast"),
+        ("Medium", "medium"),
+        ("Slow (better)", "slow"),
+    )
+    _RESOLUTION_OPTIONS = (
+        ("4K (3840p)", "3840:-2"),
+        ("1080p", "1920:-2"),
+        ("720p", "1280:-2"),
+        ("480p", "854:-2"),
+        ("Custom", "custom"),
+    )
+    _AUDIO_FORMAT_OPTIONS = (
+        ("MP3", "mp3"),
+        ("AAC", "aac"),
+        ("WAV", "wav"),
+        ("FLAC", "flac"),
+        ("OGG", "ogg"),
+    )
+    _AUDIO_QUALITY_OPTIONS = (
+        ("High (320k)", "320k"),
+        ("Good (192k)", "192k"),
+        ("Medium (128k)", "128k"),
+    )
+
+    # Seconds between output-area flushes (caps redraws at 10 FPS)
+    _FLUSH_INTERVAL = 0.1
+    # The output area is trimmed back to its last _OUTPUT_TAIL_LINES lines
+    # once it grows past _OUTPUT_TRIM_THRESHOLD, so trims happen in batches
+    _OUTPUT_TAIL_LINES = 50
+    _OUTPUT_TRIM_THRESHOLD = 500
+
+    # Widgets read on every preview/visibility update, resolved once in on_mount
+    _CACHED_WIDGET_IDS = (
+        "input-file",
+        "output-file",
+        "toggle-convert",
+        "toggle-compress",
+        "toggle-resize",
+        "toggle-trim",
+        "toggle-audio",
+        "toggle-noaudio",
+        "convert-options",
+        "compress-options",
+        "resize-options",
+        "trim-options",
+        "audio-options",
+        "output-format",
+        "quality",
+        "speed",
+        "resolution",
+        "custom-res",
+        "start-time",
+        "duration",
+        "audio-format",
+        "audio-quality",
+        "command-preview",
+        "output-area",
+    )
+
+    # Widgets whose values determine the command preview
+    _PREVIEW_INPUT_IDS = (
+        "input-file",
+        "output-file",
+        "toggle-convert",
+        "toggle-compress",
+        "toggle-resize",
+        "toggle-trim",
+        "toggle-audio",
+        "toggle-noaudio",
+        "output-format",
+        "quality",
+        "speed",
+        "resolution",
+        "custom-res",
+        "start-time",
+        "duration",
+        "audio-format",
+        "audio-quality",
+    )
+
+    # Checkbox -> option group it shows/hides
+    _TOGGLE_PAIRS = (
+        ("toggle-convert", "convert-options"),
+        ("toggle-compress", "compress-options"),
+        ("toggle-resize", "resize-options"),
+        ("toggle-trim", "trim-options"),
+        ("toggle-audio", "audio-options"),
+    )
+
     def on_mount(self) -> None:
-        # Lazy check for ffmpeg - show warning if not installed
-        if not self._check_ffmpeg_installed():
+        try:
+            self._widgets = {
+                widget_id: self.query_one(f"#{widget_id}")
+                for widget_id in self._CACHED_WIDGET_IDS
+            }
+            self._vis_pairs = [
+                (self._widgets[toggle_id], self._widgets[options_id])
+                for toggle_id, options_id in self._TOGGLE_PAIRS
+            ]
+        except Exception:
+            pass
+        # Show warning if ffmpeg is not installed
+        if not self._ffmpeg_installed:
             try:
                 self.query_one("#not-installed").styles.display = "block"
                 self.query_one("#install-ffmpeg").styles.display = "block"
@@ -289,156 +529,59 @@ class FFmpegScreen(Widget):
 
     def on_checkbox_changed(self, event: Checkbox.Changed) -> None:
         self._update_visibility()
-        self._update_command_preview()
+        self._schedule_preview()
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        self._update_command_preview()
+        self._schedule_preview()
 
     def on_select_changed(self, event: Select.Changed) -> None:
+        self._schedule_preview()
+
+    def _schedule_preview(self) -> None:
+        """Debounce preview rebuilds so a burst of edits triggers only one."""
+        if self._preview_timer is not None:
+            self._preview_timer.stop()
+        self._preview_timer = self.set_timer(0.15, self._update_command_preview)
+
+    def _flush_preview(self) -> None:
+        """Run a pending debounced rebuild now so _current_command is current."""
+        if self._preview_timer is not None:
+            self._preview_timer.stop()
+            self._preview_timer = None
         self._update_command_preview()
 
     def _update_visibility(self) -> None:
         """Show/hide option groups based on toggles."""
-        toggle_map = {
-            "toggle-convert": "convert-options",
-            "toggle-compress": "compress-options",
-            "toggle-resize": "resize-options",
-            "toggle-trim": "trim-options",
-            "toggle-audio": "audio-options",
-        }
-
-        for toggle_id, options_id in toggle_map.items():
-            try:
-                toggle = self.query_one(f"#{toggle_id}", Checkbox)
-                options = self.query_one(f"#{options_id}")
-                if toggle.value:
-                    options.styles.display = "block"
-                else:
-                    options.styles.display = "none"
-            except Exception:
-                pass
+        for toggle, options in self._vis_pairs:
+            target = "block" if toggle.value else "none"
+            # Assigning an unchanged value still invalidates layout
+            if options.styles.display != target:
+                options.styles.display = target
+
+    def _read_state(self) -> _PreviewState:
+        """Snapshot the form values the preview is built from."""
+        w = self._widgets
+        return _PreviewState(
+            *(w[widget_id].value for widget_id in self._PREVIEW_INPUT_IDS)
+        )
 
     def _update_command_preview(self) -> None:
         """Build FFmpeg command based on selections."""
-        cmd = ["ffmpeg", "-y"]  # -y to overwrite
+        # Widgets are cached in on_mount; nothing to read until then
+        if not self._widgets:
+            return
+        # Events like cursor moves don't change any value - skip the rebuild
+        state = self._read_state()
+        if state == self._last_snapshot:
+            return
+        self._last_snapshot = state
 
-        try:
-            inp = self.query_one("#input-file", PathInput).value.strip()
-            inp = os.path.expanduser(inp) if inp else ""
-
-            # Trim - start time before input for fast seeking
-            if self.query_one("#toggle-trim", Checkbox).value:
-                start = self.query_one("#start-time", Input).value.strip()
-                if start:
-                    cmd.extend(["-ss", start])
-
-            # Input
-            if inp:
-                cmd.extend(["-i", inp])
-
-            # Duration after input
-            if self.query_one("#toggle-trim", Checkbox).value:
-                dur = self.query_one("#duration", Input).value.strip()
-                if dur:
-                    cmd.extend(["-t", dur])
-
-            # Audio extraction mode
-            if self.query_one("#toggle-audio", Checkbox).value:
-                cmd.append("-vn")  # No video
-                fmt = self.query_one("#audio-format", Select).value
-                qual = self.query_one("#audio-quality", Select).value
-
-                if fmt == "mp3":
-                    cmd.extend(["-c:a", "libmp3lame", "-b:a", qual])
-                elif fmt == "aac":
-                    cmd.extend(["-c:a", "aac", "-b:a", qual])
-                elif fmt == "wav":
-                    cmd.extend(["-c:a", "pcm_s16le"])
-                elif fmt == "flac":
-                    cmd.extend(["-c:a", "flac"])
-                elif fmt == "ogg":
-                    cmd.extend(["-c:a", "libvorbis", "-b:a", qual])
-
-                # Output
-                out = self.query_one("#output-file", PathInput).value.strip()
-                out = os.path.expanduser(out) if out else ""
-                if not out and inp:
-                    base = os.path.splitext(inp)[0]
-                    out = f"{base}.{fmt}"
-                if out:
-                    cmd.append(out)
-            else:
-                # Video processing - preserve input format unless converting
-                if self.query_one("#toggle-convert", Checkbox).value:
-                    out_fmt = self.query_one("#output-format", Select).value
-                    if out_fmt == "mp4":
-                        cmd.extend(["-c:v", "libx264", "-c:a", "aac"])
-                    elif out_fmt == "webm":
-                        cmd.extend(["-c:v", "libvpx-vp9", "-c:a", "libopus"])
-                    elif out_fmt == "mov":
-                        cmd.extend(["-c:v", "libx264", "-c:a", "aac"])
-                else:
-                    # Keep original format
-                    out_fmt = (
-                        os.path.splitext(inp)[1].lstrip(".").lower() if inp else "mp4"
-                    )
-                    if not out_fmt:
-                        out_fmt = "mp4"
-
-                # Compression
-                if self.query_one("#toggle-compress", Checkbox).value:
-                    crf = self.query_one("#quality", Select).value
-                    speed = self.query_one("#speed", Select).value
-                    cmd.extend(["-crf", crf, "-preset", speed])
-
-                # Resize
-                if self.query_one("#toggle-resize", Checkbox).value:
-                    res = self.query_one("#resolution", Select).value
-                    if res == "custom":
-                        custom = self.query_one("#custom-res", Input).value.strip()
-                        if custom:
-                            cmd.extend(["-vf", f"scale={custom}"])
-                    else:
-                        cmd.extend(["-vf", f"scale={res}"])
-
-                # Remove audio
-                if self.query_one("#toggle-noaudio", Checkbox).value:
-                    cmd.append("-an")
-
-                # Output
-                out = self.query_one("#output-file", PathInput).value.strip()
-                out = os.path.expanduser(out) if out else ""
-                if not out and inp:
-                    base = os.path.splitext(inp)[0]
-                    suffix = "_output"
-                    if self.query_one("#toggle-compress", Checkbox).value:
-                        suffix = "_compressed"
-                    elif self.query_one("#toggle-resize", Checkbox).value:
-                        suffix = "_resized"
-                    elif self.query_one("#toggle-trim", Checkbox).value:
-                        suffix = "_trimmed"
-                    out = f"{base}{suffix}.{out_fmt}"
-                if out:
-                    cmd.append(out)
-
-            self._current_command = cmd
-            preview = self.query_one("#command-preview", Static)
-            # Format nicely
-            if len(cmd) > 6:
-                formatted = (
-                    cmd[0]
-                    + " "
-                    + cmd[1]
-                    + " \\\n  "
-                    + " \\\n  ".join(
-                        [" ".join(cmd[i : i + 2]) for i in range(2, len(cmd), 2)]
-                    )
-                )
-                preview.update(formatted)
-            else:
-                preview.update(" ".join(cmd))
-        except Exception as e:
-            pass
+        cmd = _build_cmd(state)
+        self._current_command = list(cmd)
+        formatted = _format_cmd(cmd)
+        if formatted != self._last_formatted:
+            self._widgets["command-preview"].update(formatted)
+            self._last_formatted = formatted
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "install-ffmpeg":
@@ -451,19 +594,15 @@ class FFmpegScreen(Widget):
             self._clear_form()
 
     def _install_ffmpeg(self) -> None:
-        output = self.query_one("#output-area", TextArea)
+        self._stop_process()
+        output = self._widgets["output-area"]
         output.load_text("Installing FFmpeg via Homebrew...\n")
-        self._process = subprocess.Popen(
-            ["brew", "install", "ffmpeg"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-        )
-        self._output_lines = []
-        self.set_timer(0.1, self._poll_process)
+        self._installing = True
+        self._stream_process(["brew", "install", "ffmpeg"])
 
     def _run_command(self) -> None:
-        inp = self.query_one("#input-file", PathInput).value.strip()
+        self._flush_preview()
+        inp = self._widgets["input-file"].value.strip()
         inp = os.path.expanduser(inp) if inp else ""
         if not inp:
             self.app.notify("Please specify an input file", severity="warning")
@@ -472,7 +611,7 @@ class FFmpegScreen(Widget):
         # Check if input file exists
         if not os.path.isfile(inp):
             self.app.notify("Input file not found", severity="error")
-            output = self.query_one("#output-area", TextArea)
+            output = self._widgets["output-area"]
             # Show diagnostic info about the path
             special_chars = [
                 f"  pos {i}: U+{ord(c):04X}" for i, c in enumerate(inp) if ord(c) > 127
@@ -489,64 +628,125 @@ class FFmpegScreen(Widget):
             )
             return
 
-        output = self.query_one("#output-area", TextArea)
+        self._stop_process()
+        output = self._widgets["output-area"]
         output.load_text(f"Running...\n\n")
 
-        self._process = subprocess.Popen(
-            self._current_command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-        )
-        self._output_lines = []
-        self.set_timer(0.1, self._poll_process)
-
-    def _poll_process(self) -> None:
-        if self._process is None:
-            return
+        self._stream_process(self._current_command)
 
-        import fcntl
+    @work(exclusive=True, group="ffmpeg-process")
+    async def _stream_process(self, cmd: list[str]) -> None:
+        """Run cmd and stream its combined output into the output area.
 
+        Runs on the app's event loop, so there is no reader thread. Output
+        is read in 64 KiB chunks and split by OutputLines, which ends a
+        line at "\r" as well as "\n", so ffmpeg's carriage-return progress
+        updates show up live. Reading chunks rather than lines also keeps
+        them clear of the StreamReader line limit. The process gets its
+        own session so _stop_process can signal its whole group.
+        """
+        self._pending_lines.clear()
         try:
-            fd = self._process.stdout.fileno()
-            fl = fcntl.fcntl(fd, fcntl.F_GETFL)
-            fcntl.fcntl(fd, fcntl.F_SETFL, fl | os.O_NONBLOCK)
-            line = self._process.stdout.readline()
-            if line:
-                self._output_lines.append(line)
-                output = self.query_one("#output-area", TextArea)
-                output.load_text("".join(self._output_lines[-50:]))
-                output.scroll_end(animate=False)
-        except (BlockingIOError, IOError):
-            pass
+            self._process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                start_new_session=True,
+            )
+        except OSError as e:
+            self._installing = False
+            self._pending_lines.append(f"Error: {e}\n")
+            self._flush_output()
+            return
 
-        ret = self._process.poll()
-        if ret is None:
-            self.set_timer(0.2, self._poll_process)
-        else:
-            status = "\n✓ Done!" if ret == 0 else f"\n✗ Failed (code {ret})"
-            self._output_lines.append(status)
-            output = self.query_one("#output-area", TextArea)
-            output.load_text("".join(self._output_lines[-50:]))
-            output.scroll_end(animate=False)
+        # The reader only fills _pending_lines; the interval does the
+        # rendering, so redraws are bounded however fast ffmpeg logs.
+        flush_timer = self.set_interval(self._FLUSH_INTERVAL, self._flush_output)
+        try:
+            lines = OutputLines()
+            while data := await self._process.stdout.read(65536):
+                self._pending_lines.extend(lines.feed(data))
+            self._pending_lines.extend(lines.close())
+            ret = await self._process.wait()
+        finally:
+            flush_timer.stop()
+
+        status = "\n✓ Done!" if ret == 0 else f"\n✗ Failed (code {ret})"
+        self._pending_lines.append(status)
+        self._flush_output()
+        if ret == 0:
+            self.app.notify("FFmpeg completed!")
+        if self._installing:
+            self._installing = False
             if ret == 0:
-                self.app.notify("FFmpeg completed!")
-            self._process = None
+                # PATH walk off the UI thread; handled in on_worker_state_changed
+                self.run_worker(
+                    lambda: shutil.which("ffmpeg"), name="ffmpeg_which", thread=True
+                )
+        self._process = None
+
+    def _flush_output(self) -> None:
+        """Append pending lines to the output area in a single insert.
+
+        Only the new text is inserted; the document is never reloaded.
+        """
+        if not self._pending_lines:
+            return
+        output = self._widgets["output-area"]
+        text = "".join(self._pending_lines)
+        self._pending_lines.clear()
+        output.insert(text, output.document.end)
+        line_count = output.document.line_count
+        if line_count > self._OUTPUT_TRIM_THRESHOLD:
+            output.delete((0, 0), (line_count - self._OUTPUT_TAIL_LINES, 0))
+        output.scroll_end(animate=False)
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Hide the install prompt once a fresh install is found on PATH."""
+        global _FFMPEG_PATH
+        if event.worker.name != "ffmpeg_which" or event.state.name != "SUCCESS":
+            return
+        _FFMPEG_PATH = event.worker.result
+        self._ffmpeg_installed = _FFMPEG_PATH is not None
+        if self._ffmpeg_installed:
+            try:
+                self.query_one("#not-installed").styles.display = "none"
+                self.query_one("#install-ffmpeg").styles.display = "none"
+            except Exception:
+                pass
 
     def _copy_command(self) -> None:
+        self._flush_preview()
         try:
-            import pyperclip
-
             pyperclip.copy(" ".join(self._current_command))
             self.app.notify("Copied!")
         except:
             self.app.notify("Copy failed", severity="error")
 
+    def _stop_process(self) -> None:
+        """Cancel the streaming worker and terminate a still-running process.
+
+        Without this a Clear or a second Run leaves the previous ffmpeg
+        running unseen, competing with the new one for CPU.
+        """
+        self.workers.cancel_group(self, "ffmpeg-process")
+        self._pending_lines.clear()
+        self._installing = False
+        proc, self._process = self._process, None
+        if proc is None or proc.returncode is not None:
+            return
+        try:
+            # start_new_session made the process its own group leader
+            os.killpg(proc.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
     def _clear_form(self) -> None:
+        self._stop_process()
         for inp in self.query(Input):
             inp.value = ""
         for cb in self.query(Checkbox):
             cb.value = False
         self._update_visibility()
         self._update_command_preview()
-        self.query_one("#output-area", TextArea).load_text("")
+        self._widgets["output-area"].load_text("")
@@ -1,16 +1,30 @@
 """ImageMagick command builder screen."""
 
+import asyncio
 import os
 import shutil
-import subprocess
+from functools import cache, lru_cache
 
+import pyperclip
+from textual import work
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.widget import Widget
 from textual.widgets import Button, Checkbox, Input, Select, Static, TextArea
+from textual.worker import Worker
 
+from devops.screens.process_output import OutputLines
 from devops.widgets.path_input import PathInput
 
+# Called on every preview rebuild with mostly the same few paths
+_expanduser = lru_cache(maxsize=32)(os.path.expanduser)
+
+
+@cache
+def _magick_available() -> bool:
+    """PATH lookup for ImageMagick, shared by every screen instance."""
+    return shutil.which("magick") is not None or shutil.which("convert") is not None
+
 
 class ImageMagickScreen(Widget):
     """ImageMagick command builder interface."""
@@ -117,16 +131,20 @@ class ImageMagickScreen(Widget):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._magick_installed: bool | None = None  # Lazy check
+        self._installing = False
         self._current_command = ["magick"]
         self._process = None
+        self._preview_timer = None
+        self._last_formatted: str | None = None
+        self._widgets: dict[str, Widget] = {}
+        self._vis_pairs: list[tuple[Checkbox, Widget]] = []
+        self._inputs: list[Input] = []
+        self._checkboxes: list[Checkbox] = []
 
     def _check_magick_installed(self) -> bool:
         """Lazy check for ImageMagick installation."""
         if self._magick_installed is None:
-            self._magick_installed = (
-                shutil.which("magick") is not None
-                or shutil.which("convert") is not None
-            )
+            self._magick_installed = _magick_available()
         return self._magick_installed
 
     def compose(self) -> ComposeResult:
@@ -162,27 +180,17 @@ class ImageMagickScreen(Widget):
                 with Vertical(id="convert-options", classes="options-group hidden"):
                     yield Static("Output format:")
                     yield Select(
-                        [
-                            (("JPEG - small, photos", "jpg")),
-                            (("PNG - lossless", "png")),
-                            (("WebP - modern, small", "webp")),
-                            (("GIF", "gif")),
-                            (("TIFF - high quality", "tiff")),
-                            (("PDF", "pdf")),
-                        ],
+                        self._FORMAT_OPTIONS,
                         id="output-format",
                         value="jpg",
+                        allow_blank=False,
                     )
                     yield Static("Quality (1-100):")
                     yield Select(
-                        [
-                            (("High (95)", "95")),
-                            (("Good (85)", "85")),
-                            (("Medium (75)", "75")),
-                            (("Low (60)", "60")),
-                        ],
+                        self._QUALITY_OPTIONS,
                         id="quality",
                         value="85",
+                        allow_blank=False,
                     )
 
                 # Resize
@@ -190,17 +198,10 @@ class ImageMagickScreen(Widget):
                 with Vertical(id="resize-options", classes="options-group hidden"):
                     yield Static("Resize to:")
                     yield Select(
-                        [
-                            (("50%", "50%")),
-                            (("25%", "25%")),
-                            (("1920px wide", "1920x")),
-                            (("1280px wide", "1280x")),
-                            (("800px wide", "800x")),
-                            (("Thumbnail 150px", "150x150")),
-                            (("Custom", "custom")),
-                        ],
+                        self._RESIZE_OPTIONS,
                         id="resize",
                         value="50%",
+                        allow_blank=False,
                     )
                     yield Input(
                         placeholder="WxH or W% (e.g., 800x600)", id="resize-custom"
@@ -211,14 +212,10 @@ class ImageMagickScreen(Widget):
                 with Vertical(id="crop-options", classes="options-group hidden"):
                     yield Static("Crop to:")
                     yield Select(
-                        [
-                            (("Square (1:1)", "1:1")),
-                            (("16:9 widescreen", "16:9")),
-                            (("4:3 standard", "4:3")),
-                            (("Custom", "custom")),
-                        ],
+                        self._CROP_OPTIONS,
                         id="crop",
                         value="1:1",
+                        allow_blank=False,
                     )
                     yield Input(
                         placeholder="WxH+X+Y (e.g., 800x600+100+50)", id="crop-custom"
@@ -231,16 +228,10 @@ class ImageMagickScreen(Widget):
                 with Vertical(id="rotate-options", classes="options-group hidden"):
                     yield Static("Rotation:")
                     yield Select(
-                        [
-                            (("90° clockwise", "90")),
-                            (("90° counter-clockwise", "-90")),
-                            (("180°", "180")),
-                            (("Flip vertical", "flip")),
-                            (("Flip horizontal", "flop")),
-                            (("Auto-orient", "auto")),
-                        ],
+                        self._ROTATE_OPTIONS,
                         id="rotate",
                         value="90",
+                        allow_blank=False,
                     )
 
                 # Adjustments
@@ -290,7 +281,108 @@ class ImageMagickScreen(Widget):
                 yield Static("\nOutput", classes="section-header")
                 yield TextArea(id="output-area", read_only=True)
 
+    # Select options, built once rather than on every compose
+    _FORMAT_OPTIONS = (
+        ("JPEG - small, photos", "jpg"),
+        ("PNG - lossless", "png"),
+        ("WebP - modern, small", "webp"),
+        ("GIF", "gif"),
+        ("TIFF - high quality", "tiff"),
+        ("PDF", "pdf"),
+    )
+    _QUALITY_OPTIONS = (
+        ("High (95)", "95"),
+        ("Good (85)", "85"),
+        ("Medium (75)", "75"),
+        ("Low (60)", "60"),
+    )
+    _RESIZE_OPTIONS = (
+        ("50%", "50%"),
+        ("25%", "25%"),
+        ("1920px wide", "1920x"),
+        ("1280px wide", "1280x"),
+        ("800px wide", "800x"),
+        ("Thumbnail 150px", "150x150"),
+        ("Custom", "custom"),
+    )
+    _CROP_OPTIONS = (
+        ("Square (1:1)", "1:1"),
+        ("16:9 widescreen", "16:9"),
+        ("4:3 standard", "4:3"),
+        ("Custom", "custom"),
+    )
+    _ROTATE_OPTIONS = (
+        ("90° clockwise", "90"),
+        ("90° counter-clockwise", "-90"),
+        ("180°", "180"),
+        ("Flip vertical", "flip"),
+        ("Flip horizontal", "flop"),
+        ("Auto-orient", "auto"),
+    )
+
+    # The output area is trimmed back to its last _OUTPUT_TAIL_LINES lines
+    # once it grows past _OUTPUT_TRIM_THRESHOLD, so trims happen in batches
+    _OUTPUT_TAIL_LINES = 50
+    _OUTPUT_TRIM_THRESHOLD = 500
+
+    # Widgets read on every preview/visibility update, resolved once in on_mount
+    _CACHED_WIDGET_IDS = (
+        "input-file",
+        "output-file",
+        "toggle-convert",
+        "toggle-resize",
+        "toggle-crop",
+        "toggle-rotate",
+        "toggle-adjust",
+        "toggle-effects",
+        "toggle-strip",
+        "convert-options",
+        "resize-options",
+        "crop-options",
+        "rotate-options",
+        "adjust-options",
+        "effects-options",
+        "output-format",
+        "quality",
+        "resize",
+        "resize-custom",
+        "crop",
+        "crop-custom",
+        "rotate",
+        "brightness",
+        "contrast",
+        "saturation",
+        "blur",
+        "sharpen",
+        "command-preview",
+        "output-area",
+    )
+
+    # Checkbox -> option group it shows/hides
+    _TOGGLE_PAIRS = (
+        ("toggle-convert", "convert-options"),
+        ("toggle-resize", "resize-options"),
+        ("toggle-crop", "crop-options"),
+        ("toggle-rotate", "rotate-options"),
+        ("toggle-adjust", "adjust-options"),
+        ("toggle-effects", "effects-options"),
+    )
+
     def on_mount(self) -> None:
+        try:
+            self._widgets = {
+                widget_id: self.query_one(f"#{widget_id}")
+                for widget_id in self._CACHED_WIDGET_IDS
+            }
+            self._vis_pairs = [
+                (self._widgets[toggle_id], self._widgets[options_id])
+                for toggle_id, options_id in self._TOGGLE_PAIRS
+            ]
+        except Exception:
+            pass
+        # Everything Clear resets; includes the Inputs inside each PathInput
+        self._inputs = list(self.query(Input))
+        self._checkboxes = list(self.query(Checkbox))
         # Lazy check for imagemagick - show warning if not installed
         if not self._check_magick_installed():
             try:
@@ -303,127 +395,134 @@ class ImageMagickScreen(Widget):
 
     def on_checkbox_changed(self, event: Checkbox.Changed) -> None:
         self._update_visibility()
-        self._update_command_preview()
+        self._schedule_preview()
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        self._update_command_preview()
+        self._schedule_preview()
 
     def on_select_changed(self, event: Select.Changed) -> None:
+        self._schedule_preview()
+
+    def _schedule_preview(self) -> None:
+        """Debounce preview rebuilds so a burst of edits triggers only one."""
+        if self._preview_timer is not None:
+            self._preview_timer.stop()
+        self._preview_timer = self.set_timer(0.05, self._update_command_preview)
+
+    def _flush_preview(self) -> None:
+        """Run a pending debounced rebuild now so _current_command is current."""
+        if self._preview_timer is not None:
+            self._preview_timer.stop()
+            self._preview_timer = None
         self._update_command_preview()
 
     def _update_visibility(self) -> None:
         """Show/hide option groups based on toggles."""
-        toggle_map = {
-            "toggle-convert": "convert-options",
-            "toggle-resize": "resize-options",
-            "toggle-crop": "crop-options",
-            "toggle-rotate": "rotate-options",
-            "toggle-adjust": "adjust-options",
-            "toggle-effects": "effects-options",
-        }
-
-        for toggle_id, options_id in toggle_map.items():
-            try:
-                toggle = self.query_one(f"#{toggle_id}", Checkbox)
-                options = self.query_one(f"#{options_id}")
-                if toggle.value:
-                    options.styles.display = "block"
-                else:
-                    options.styles.display = "none"
-            except Exception:
-                pass
+        for toggle, options in self._vis_pairs:
+            target = "block" if toggle.value else "none"
+            # Assigning an unchanged value still invalidates layout
+            if options.styles.display != target:
+                options.styles.display = target
 
     def _update_command_preview(self) -> None:
         """Build ImageMagick command."""
+        w = self._widgets
+        # Widgets are cached in on_mount; nothing to read until then
+        if not w:
+            return
         cmd = ["magick"]
-
-        try:
-            inp = self.query_one("#input-file", PathInput).value.strip()
-            inp = os.path.expanduser(inp) if inp else ""
-            if inp:
-                cmd.append(inp)
-
-            # Resize
-            if self.query_one("#toggle-resize", Checkbox).value:
-                resize = self.query_one("#resize", Select).value
-                if resize == "custom":
-                    custom = self.query_one("#resize-custom", Input).value.strip()
-                    if custom:
-                        cmd.extend(["-resize", custom])
-                else:
-                    cmd.extend(["-resize", resize])
-
-            # Crop
-            if self.query_one("#toggle-crop", Checkbox).value:
-                crop = self.query_one("#crop", Select).value
-                if crop == "custom":
-                    custom = self.query_one("#crop-custom", Input).value.strip()
-                    if custom:
-                        cmd.extend(["-crop", custom, "+repage"])
-                elif crop in ("1:1", "16:9", "4:3"):
-                    cmd.extend(["-gravity", "center", "-crop", crop, "+repage"])
-
-            # Rotate
-            if self.query_one("#toggle-rotate", Checkbox).value:
-                rotate = self.query_one("#rotate", Select).value
-                if rotate == "auto":
-                    cmd.append("-auto-orient")
-                elif rotate == "flip":
-                    cmd.append("-flip")
-                elif rotate == "flop":
-                    cmd.append("-flop")
-                else:
-                    cmd.extend(["-rotate", rotate])
-
-            # Adjustments
-            if self.query_one("#toggle-adjust", Checkbox).value:
-                bright = self.query_one("#brightness", Input).value.strip() or "0"
-                contrast = self.query_one("#contrast", Input).value.strip() or "0"
-                if bright != "0" or contrast != "0":
-                    cmd.extend(["-brightness-contrast", f"{bright}x{contrast}"])
-
-                sat = self.query_one("#saturation", Input).value.strip()
-                if sat:
-                    cmd.extend(["-modulate", f"100,{sat},100"])
-
-            # Effects
-            if self.query_one("#toggle-effects", Checkbox).value:
-                blur = self.query_one("#blur", Input).value.strip()
-                if blur:
-                    cmd.extend(["-blur", blur])
-                sharpen = self.query_one("#sharpen", Input).value.strip()
-                if sharpen:
-                    cmd.extend(["-sharpen", sharpen])
-
-            # Quality (if converting)
-            if self.query_one("#toggle-convert", Checkbox).value:
-                quality = self.query_one("#quality", Select).value
-                cmd.extend(["-quality", quality])
-
-            # Strip
-            if self.query_one("#toggle-strip", Checkbox).value:
-                cmd.append("-strip")
-
-            # Output
-            out = self.query_one("#output-file", PathInput).value.strip()
-            out = os.path.expanduser(out) if out else ""
-            if not out and inp:
-                base, ext = os.path.splitext(inp)
-                if self.query_one("#toggle-convert", Checkbox).value:
-                    ext = "." + self.query_one("#output-format", Select).value
-                suffix = "_edited"
-                out = f"{base}{suffix}{ext}"
-            if out:
-                cmd.append(out)
-
-            self._current_command = cmd
-            preview = self.query_one("#command-preview", Static)
-            if len(cmd) > 5:
-                preview.update(" \\\n  ".join(cmd))
+        # Local bindings; this runs on every debounced edit
+        cmd_append = cmd.append
+        cmd_extend = cmd.extend
+        convert = w["toggle-convert"].value
+
+        inp = w["input-file"].value.strip()
+        inp = _expanduser(inp) if inp else ""
+        if inp:
+            cmd_append(inp)
+
+        # Resize
+        if w["toggle-resize"].value:
+            resize = w["resize"].value
+            if resize == "custom":
+                custom = w["resize-custom"].value.strip()
+                if custom:
+                    cmd_extend(("-resize", custom))
             else:
-                preview.update(" ".join(cmd))
-        except Exception:
-            pass
+                cmd_extend(("-resize", resize))
+
+        # Crop
+        if w["toggle-crop"].value:
+            crop = w["crop"].value
+            if crop == "custom":
+                custom = w["crop-custom"].value.strip()
+                if custom:
+                    cmd_extend(("-crop", custom, "+repage"))
+            elif crop in ("1:1", "16:9", "4:3"):
+                cmd_extend(("-gravity", "center", "-crop", crop, "+repage"))
+
+        # Rotate
+        if w["toggle-rotate"].value:
+            rotate = w["rotate"].value
+            if rotate == "auto":
+                cmd_append("-auto-orient")
+            elif rotate == "flip":
+                cmd_append("-flip")
+            elif rotate == "flop":
+                cmd_append("-flop")
+            else:
+                cmd_extend(("-rotate", rotate))
+
+        # Adjustments
+        if w["toggle-adjust"].value:
+            bright = w["brightness"].value.strip() or "0"
+            contrast = w["contrast"].value.strip() or "0"
+            if bright != "0" or contrast != "0":
+                cmd_extend(("-brightness-contrast", f"{bright}x{contrast}"))
+
+            sat = w["saturation"].value.strip()
+            if sat:
+                cmd_extend(("-modulate", f"100,{sat},100"))
+
+        # Effects
+        if w["toggle-effects"].value:
+            blur = w["blur"].value.strip()
+            if blur:
+                cmd_extend(("-blur", blur))
+            sharpen = w["sharpen"].value.strip()
+            if sharpen:
+                cmd_extend(("-sharpen", sharpen))
+
+        # Quality (if converting)
+        if convert:
+            quality = w["quality"].value
+            cmd_extend(("-quality", quality))
+
+        # Strip
+        if w["toggle-strip"].value:
+            cmd_append("-strip")
+
+        # Output
+        out = w["output-file"].value.strip()
+        out = _expanduser(out) if out else ""
+        if not out and inp:
+            base, ext = os.path.splitext(inp)
+            if convert:
+                ext = "." + w["output-format"].value
+            suffix = "_edited"
+            out = f"{base}{suffix}{ext}"
+        if out:
+            cmd_append(out)
+
+        self._current_command = cmd
+        if len(cmd) > 5:
+            formatted = " \\\n  ".join(cmd)
+        else:
+            formatted = " ".join(cmd)
+        # An identical string would still re-render the Static
+        if formatted != self._last_formatted:
+            w["command-preview"].update(formatted)
+            self._last_formatted = formatted
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "install-magick":
@@ -436,20 +535,15 @@ class ImageMagickScreen(Widget):
             self._clear_form()
 
     def _install_magick(self) -> None:
-        output = self.query_one("#output-area", TextArea)
+        output = self._widgets["output-area"]
         output.load_text("Installing ImageMagick...\n")
-        self._process = subprocess.Popen(
-            ["brew", "install", "imagemagick"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-        )
-        self._output_lines = []
-        self.set_timer(0.1, self._poll_process)
+        self._installing = True
+        self._stream_process(["brew", "install", "imagemagick"])
 
     def _run_command(self) -> None:
-        inp = self.query_one("#input-file", PathInput).value.strip()
-        inp = os.path.expanduser(inp) if inp else ""
+        self._flush_preview()
+        inp = self._widgets["input-file"].value.strip()
+        inp = _expanduser(inp) if inp else ""
         if not inp:
             self.app.notify("Please specify an input file", severity="warning")
             return
@@ -457,12 +551,16 @@ class ImageMagickScreen(Widget):
         # Check if input file exists
         if not os.path.isfile(inp):
             self.app.notify("Input file not found", severity="error")
-            output = self.query_one("#output-area", TextArea)
-            # Show diagnostic info about the path
-            special_chars = [
-                f"  pos {i}: U+{ord(c):04X}" for i, c in enumerate(inp) if ord(c) > 127
-            ]
-            special_info = "\n".join(special_chars) if special_chars else "  (none)"
+            output = self._widgets["output-area"]
+            # Show diagnostic info about the path; ASCII paths have nothing to list
+            if inp.isascii():
+                special_info = "  (none)"
+            else:
+                special_info = "\n".join(
+                    f"  pos {i}: U+{ord(c):04X}"
+                    for i, c in enumerate(inp)
+                    if ord(c) > 127
+                )
             output.load_text(
                 f"Error: File not found\n\n"
                 f"Path: {inp}\n"
@@ -474,63 +572,85 @@ class ImageMagickScreen(Widget):
             )
             return
 
-        output = self.query_one("#output-area", TextArea)
+        output = self._widgets["output-area"]
         output.load_text("Running...\n\n")
 
-        self._process = subprocess.Popen(
-            self._current_command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-        )
-        self._output_lines = []
-        self.set_timer(0.1, self._poll_process)
-
-    def _poll_process(self) -> None:
-        if self._process is None:
-            return
+        self._stream_process(self._current_command)
 
-        import fcntl
+    @work(exclusive=True, group="magick-process")
+    async def _stream_process(self, cmd: list[str]) -> None:
+        """Run cmd and stream its combined output into the output area.
 
+        Runs on the app's event loop and wakes only when output arrives;
+        each read drains whatever is in the pipe, not a line per tick.
+        """
         try:
-            fd = self._process.stdout.fileno()
-            fl = fcntl.fcntl(fd, fcntl.F_GETFL)
-            fcntl.fcntl(fd, fcntl.F_SETFL, fl | os.O_NONBLOCK)
-            line = self._process.stdout.readline()
-            if line:
-                self._output_lines.append(line)
-                output = self.query_one("#output-area", TextArea)
-                output.load_text("".join(self._output_lines[-50:]))
-                output.scroll_end(animate=False)
-        except (BlockingIOError, IOError):
-            pass
+            self._process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+            )
+        except OSError as e:
+            self._installing = False
+            self._append_output(f"Error: {e}\n")
+            return
 
-        ret = self._process.poll()
-        if ret is None:
-            self.set_timer(0.2, self._poll_process)
-        else:
-            status = "\n✓ Done!" if ret == 0 else f"\n✗ Failed (code {ret})"
-            self._output_lines.append(status)
-            output = self.query_one("#output-area", TextArea)
-            output.load_text("".join(self._output_lines[-50:]))
-            output.scroll_end(animate=False)
+        lines = OutputLines()
+        while data := await self._process.stdout.read(65536):
+            if complete := lines.feed(data):
+                self._append_output("".join(complete))
+        if tail := lines.close():
+            self._append_output("".join(tail))
+
+        ret = await self._process.wait()
+        status = "\n✓ Done!" if ret == 0 else f"\n✗ Failed (code {ret})"
+        self._append_output(status)
+        if ret == 0:
+            self.app.notify("ImageMagick completed!")
+        if self._installing:
+            self._installing = False
             if ret == 0:
-                self.app.notify("ImageMagick completed!")
-            self._process = None
+                # PATH walk off the UI thread; handled in on_worker_state_changed
+                _magick_available.cache_clear()
+                self.run_worker(_magick_available, name="magick_which", thread=True)
+        self._process = None
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Hide the install prompt once a fresh install is found on PATH."""
+        if event.worker.name != "magick_which" or event.state.name != "SUCCESS":
+            return
+        self._magick_installed = event.worker.result
+        if self._magick_installed:
+            try:
+                self.query_one("#not-installed").styles.display = "none"
+                self.query_one("#install-magick").styles.display = "none"
+            except Exception:
+                pass
+
+    def _append_output(self, text: str) -> None:
+        """Append text to the output area without reloading the document."""
+        output = self._widgets["output-area"]
+        output.insert(text, output.document.end)
+        line_count = output.document.line_count
+        if line_count > self._OUTPUT_TRIM_THRESHOLD:
+            output.delete((0, 0), (line_count - self._OUTPUT_TAIL_LINES, 0))
+        output.scroll_end(animate=False)
 
     def _copy_command(self) -> None:
+        self._flush_preview()
         try:
-            import pyperclip
-
+            pyperclip.copy(" ".join(self._current_command))
             self.app.notify("Copied!")
         except:
             self.app.notify("Copy failed", severity="error")
 
     def _clear_form(self) -> None:
-        for inp in self.query(Input):
-            inp.value = ""
-        for cb in self.query(Checkbox):
-            cb.value = False
-        self._update_visibility()
-        self._update_command_preview()
-        self.query_one("#output-area", TextArea).load_text("")
+        # One repaint for the whole reset instead of one per widget
+        with self.app.batch_update():
+            for inp in self._inputs:
+                inp.value = ""
+            for cb in self._checkboxes:
+                cb.value = False
+            self._update_visibility()
+            self._update_command_preview()
+            self._widgets["output-area"].load_text("")
@@ -1,10 +1,17 @@
 """Main screen with tabbed interface for environment visualization."""
 
+import codecs
+import io
+import os
+import stat
 import subprocess
+from typing import Callable, Iterator, NamedTuple
 
 import pyperclip
 from textual.app import ComposeResult
 from textual.containers import Horizontal
+from textual.css.query import NoMatches
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Static, TabbedContent, TabPane, Tree
 from textual.worker import Worker, get_current_worker
@@ -15,8 +22,7 @@ from devops.cache.brew_list_cache import CacheKey, get_brew_list_cache
 from devops.cache.git_cache import (
     add_repos,
     add_scan_dir,
-    load_cached_repos,
-    load_scan_dirs,
+    load_git_config,
     remove_scan_dir,
 )
 from devops.cache.git_cache import (
@@ -30,7 +36,7 @@ from devops.collectors.homebrew import HomebrewCollector
 from devops.collectors.homebrew_async import (
     BrewCollectResult,
     build_entries_from_result,
-    collect_all_sync,
+    collect_all_async,
 )
 from devops.collectors.node import NodeCollector
 from devops.collectors.npm import NpmCollector
@@ -44,6 +50,33 @@ from devops.widgets.detail_panel import DetailPanel
 from devops.widgets.env_tree import EnvTree
 
 
+def _iter_output(proc: subprocess.Popen) -> Iterator[str]:
+    """Yield a process's output as it arrives, one decoded chunk per read."""
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True
+    )
+    # read1 blocks only until some bytes are available, so bursts arrive together
+    while data := proc.stdout.read1(65536):
+        chunk = decoder.decode(data)
+        if chunk:
+            yield chunk
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+class _TabSpec(NamedTuple):
+    """How a tab loads on first activation and renders its welcome panel."""
+
+    detail_id: str
+    loaded_attr: str | None
+    loader: str | None
+    loading_msg: str | None
+    welcome: Callable[["MainScreen", DetailPanel], None]
+    # Worker the loader starts, so a load already in flight isn't restarted
+    worker: str | None = None
+
+
 class MainScreen(Widget):
     """Main screen with tabbed interface for environment visualization."""
 
@@ -108,8 +141,53 @@ class MainScreen(Widget):
         self._asdf_loaded = False
         self._git_loaded = False
 
+        # Tabs whose first load is waiting on its activation delay
+        self._tab_loads_scheduled: set[str] = set()
+
         # Background sync state
         self._brew_syncing = False
+        self._brew_resync_pending = False
+
+        # Welcome-panel summaries, recomputed by _update_aggregates on each load
+        self._outdated_count = 0
+        self._broken_count = 0
+        self._detected_python_sources: list[str] = []
+        self._asdf_plugins: list[str] = []
+
+        # Last loaded shell entries, so an edit reparses only the file it touched
+        self._shell_entries: list[EnvEntry] = []
+
+        # Tree refreshes waiting out a burst of edits; None means a full reload
+        self._shell_refresh_paths: set[str | None] = set()
+        self._symlinks_refresh_pending = False
+
+        # Version manager names, detected once (may shell out to brew)
+        self._node_manager: str | None = None
+        self._ruby_manager: str | None = None
+
+        # Git config from the repo cache file, reread only after it changes
+        self._repos_cache: list[str] | None = None
+        self._scan_dirs_cache: list[str] | None = None
+
+        # Tree and detail widgets by id, resolved on first lookup
+        self._trees: dict[str, EnvTree] = {}
+        self._panels: dict[str, DetailPanel] = {}
+
+        # Running npm/brew commands, streamed by _spawn_streaming
+        self._npm_process: subprocess.Popen | None = None
+        self._brew_update_process: subprocess.Popen | None = None
+        self._brew_process: subprocess.Popen | None = None
+
+        # Packages queued for a single batched brew upgrade
+        self._brew_batch: list[str] = []
+        self._brew_flush_timer: Timer | None = None
+
+        # Alias copy waiting for the selection to settle: (text, alias name)
+        self._pending_clip: tuple[str, str] | None = None
+        self._clipboard_timer: Timer | None = None
+
+        # Last (tree, node data, panel generation, state) rendered by a selection
+        self._last_selection: tuple | None = None
 
         # Confirmation skip flag
         self._skip_confirmations = False
@@ -186,6 +264,9 @@ class MainScreen(Widget):
                     yield DetailPanel(id="npm-detail")
 
     def on_mount(self) -> None:
+        # Brew sync is the slowest load and needs no collector; start it now so
+        # it overlaps startup (_load_brew_data joins it instead of restarting)
+        self._start_brew_sync()
         # Defer ALL initialization to let the loading animation run smoothly
         self.set_timer(0.01, self._deferred_init)
 
@@ -196,12 +277,10 @@ class MainScreen(Widget):
         self._load_shell_data()
         # Clear loading flag after shell data is loaded
         self._loading_initial_data = False
-        # Load everything else in background
-        self.set_timer(0.05, self._load_path_data)
-        self.set_timer(0.1, self._load_symlinks_data)
-        self.set_timer(0.15, self._load_brew_data)
-        self.set_timer(0.2, self._load_python_data)
-        self.set_timer(0.25, self._load_npm_data)
+        # Load everything else in parallel on worker threads
+        for key in ("path", "symlinks", "python", "npm"):
+            self._start_collector(key)
+        self._load_brew_data()
 
     def _init_collectors(self) -> None:
         """Initialize collectors. Called from on_mount to avoid blocking app startup."""
@@ -236,214 +315,264 @@ class MainScreen(Widget):
             self._initial_load = False
             return
 
-        if pane_id == "shell-tab":
-            try:
-                panel = self.query_one("#shell-detail", DetailPanel)
-                panel.show_shell_welcome()
-            except Exception:
-                pass
-        elif pane_id == "path-tab":
-            try:
-                panel = self.query_one("#path-detail", DetailPanel)
-                panel.show_path_welcome()
-            except Exception:
-                pass
-        elif pane_id == "symlinks-tab":
-            try:
-                panel = self.query_one("#symlinks-detail", DetailPanel)
-                broken = self._get_broken_count()
-                panel.show_symlinks_welcome(broken)
-            except Exception:
-                pass
-        elif pane_id == "brew-tab":
-            if not self._brew_loaded:
-                self.app.notify("Loading Homebrew packages...", timeout=2)
-                self.set_timer(0.1, self._load_brew_data)
-            try:
-                panel = self.query_one("#brew-detail", DetailPanel)
-                outdated = self._get_outdated_count()
-                panel.show_homebrew_welcome(outdated, loading=not self._brew_loaded)
-            except Exception:
-                pass
-        elif pane_id == "python-tab":
-            if not self._python_loaded:
-                self.app.notify("Loading Python environments...", timeout=2)
-                self.set_timer(0.1, self._load_python_data)
-            try:
-                panel = self.query_one("#python-detail", DetailPanel)
-                detected = self._get_detected_python_sources()
-                panel.show_python_welcome(detected)
-            except Exception:
-                pass
-        elif pane_id == "node-tab":
-            if not self._node_loaded:
-                self.app.notify("Loading Node.js versions...", timeout=2)
-                self.set_timer(0.1, self._load_node_data)
-            try:
-                panel = self.query_one("#node-detail", DetailPanel)
-                manager = (
-                    self._node_collector._detect_manager()
-                    if self._node_collector
-                    else "unknown"
-                )
-                panel.show_node_welcome(manager)
-            except Exception:
-                pass
-        elif pane_id == "ruby-tab":
-            if not self._ruby_loaded:
-                self.app.notify("Loading Ruby versions...", timeout=2)
-                self.set_timer(0.1, self._load_ruby_data)
-            try:
-                panel = self.query_one("#ruby-detail", DetailPanel)
-                manager = (
-                    self._ruby_collector._detect_manager()
-                    if self._ruby_collector
-                    else "unknown"
-                )
-                panel.show_ruby_welcome(manager)
-            except Exception:
-                pass
-        elif pane_id == "rust-tab":
-            if not self._rust_loaded:
-                self.app.notify("Loading Rust toolchains...", timeout=2)
-                self.set_timer(0.1, self._load_rust_data)
-            try:
-                panel = self.query_one("#rust-detail", DetailPanel)
-                panel.show_rust_welcome()
-            except Exception:
-                pass
-        elif pane_id == "asdf-tab":
-            if not self._asdf_loaded:
-                self.app.notify("Loading asdf plugins...", timeout=2)
-                self.set_timer(0.1, self._load_asdf_data)
-            try:
-                panel = self.query_one("#asdf-detail", DetailPanel)
-                plugins = self._get_asdf_plugins()
-                panel.show_asdf_welcome(plugins)
-            except Exception:
-                pass
-        elif pane_id == "npm-tab":
-            if not self._npm_loaded:
-                self.app.notify("Loading NPM packages...", timeout=2)
-                self.set_timer(0.1, self._load_npm_data)
-            try:
-                panel = self.query_one("#npm-detail", DetailPanel)
-                panel.show_npm_welcome()
-            except Exception:
-                pass
-        elif pane_id == "git-tab":
-            if not self._git_loaded:
-                # Show loading state immediately
-                try:
-                    panel = self.query_one("#git-detail", DetailPanel)
-                    repos = load_cached_repos()
-                    scan_dirs = load_scan_dirs()
-                    if repos:
-                        panel.show_git_welcome(len(repos), scan_dirs, loading=True)
-                except Exception:
-                    pass
-                self.set_timer(0.1, self._load_git_data)
-            else:
-                # Check if we have repos - show setup or welcome
-                try:
-                    panel = self.query_one("#git-detail", DetailPanel)
-                    repos = load_cached_repos()
-                    scan_dirs = load_scan_dirs()
-                    if not repos:
-                        panel.show_git_setup()
-                    else:
-                        panel.show_git_welcome(len(repos), scan_dirs)
-                except Exception:
-                    pass
+        spec = self._TAB_SPECS.get(pane_id)
+        if spec is None:
+            return
+        if (
+            spec.loaded_attr
+            and not getattr(self, spec.loaded_attr)
+            and not self._tab_load_in_flight(pane_id, spec)
+        ):
+            if spec.loading_msg:
+                self.app.notify(spec.loading_msg, timeout=2)
+            self._tab_loads_scheduled.add(pane_id)
+            self.set_timer(0.1, lambda: self._run_tab_loader(pane_id, spec))
+        panel = self._try_panel(spec.detail_id)
+        if panel is not None:
+            spec.welcome(self, panel)
+
+    def _tab_load_in_flight(self, pane_id: str, spec: _TabSpec) -> bool:
+        """Whether a tab's load is scheduled or its worker is still running."""
+        if pane_id in self._tab_loads_scheduled:
+            return True
+        return any(
+            w.name == spec.worker and w.node is self and not w.is_finished
+            for w in self.workers
+        )
+
+    def _run_tab_loader(self, pane_id: str, spec: _TabSpec) -> None:
+        """Start a tab's first load once its short activation delay is up."""
+        self._tab_loads_scheduled.discard(pane_id)
+        getattr(self, spec.loader)()
+
+    def _show_git_tab_welcome(self, panel: DetailPanel) -> None:
+        """Show the git welcome, or setup once loading finds no repos."""
+        repos = self._repos()
+        if not self._git_loaded:
+            # Show loading state immediately
+            if repos:
+                panel.show_git_welcome(len(repos), self._scan_dirs(), loading=True)
+        elif not repos:
+            panel.show_git_setup()
+        else:
+            panel.show_git_welcome(len(repos), self._scan_dirs())
+
+    # pane id -> what to load on first visit and which welcome to show
+    _TAB_SPECS = {
+        "shell-tab": _TabSpec(
+            "shell-detail", None, None, None, lambda s, p: p.show_shell_welcome()
+        ),
+        "path-tab": _TabSpec(
+            "path-detail", None, None, None, lambda s, p: p.show_path_welcome()
+        ),
+        "symlinks-tab": _TabSpec(
+            "symlinks-detail",
+            None,
+            None,
+            None,
+            lambda s, p: p.show_symlinks_welcome(s._get_broken_count()),
+        ),
+        "brew-tab": _TabSpec(
+            "brew-detail",
+            "_brew_loaded",
+            "_load_brew_data",
+            "Loading Homebrew packages...",
+            lambda s, p: p.show_homebrew_welcome(
+                s._get_outdated_count(), loading=not s._brew_loaded
+            ),
+            worker="brew_sync",
+        ),
+        "python-tab": _TabSpec(
+            "python-detail",
+            "_python_loaded",
+            "_load_python_data",
+            "Loading Python environments...",
+            lambda s, p: p.show_python_welcome(s._get_detected_python_sources()),
+            worker="load_python",
+        ),
+        "node-tab": _TabSpec(
+            "node-detail",
+            "_node_loaded",
+            "_load_node_data",
+            "Loading Node.js versions...",
+            lambda s, p: p.show_node_welcome(s._get_node_manager()),
+            worker="load_node",
+        ),
+        "ruby-tab": _TabSpec(
+            "ruby-detail",
+            "_ruby_loaded",
+            "_load_ruby_data",
+            "Loading Ruby versions...",
+            lambda s, p: p.show_ruby_welcome(s._get_ruby_manager()),
+            worker="load_ruby",
+        ),
+        "rust-tab": _TabSpec(
+            "rust-detail",
+            "_rust_loaded",
+            "_load_rust_data",
+            "Loading Rust toolchains...",
+            lambda s, p: p.show_rust_welcome(),
+            worker="load_rust",
+        ),
+        "asdf-tab": _TabSpec(
+            "asdf-detail",
+            "_asdf_loaded",
+            "_load_asdf_data",
+            "Loading asdf plugins...",
+            lambda s, p: p.show_asdf_welcome(s._get_asdf_plugins()),
+            worker="load_asdf",
+        ),
+        "npm-tab": _TabSpec(
+            "npm-detail",
+            "_npm_loaded",
+            "_load_npm_data",
+            "Loading NPM packages...",
+            lambda s, p: p.show_npm_welcome(),
+            worker="load_npm",
+        ),
+        "git-tab": _TabSpec(
+            "git-detail",
+            "_git_loaded",
+            "_load_git_data",
+            None,
+            lambda s, p: s._show_git_tab_welcome(p),
+            worker="git_collect",
+        ),
+    }
+
+    def _tree(self, tree_id: str) -> EnvTree:
+        """Get a tab's tree by id, caching the DOM lookup."""
+        tree = self._trees.get(tree_id)
+        if tree is None:
+            tree = self._trees[tree_id] = self.query_one(f"#{tree_id}", EnvTree)
+        return tree
+
+    def _panel(self, panel_id: str) -> DetailPanel:
+        """Get a tab's detail panel by id, caching the DOM lookup."""
+        panel = self._panels.get(panel_id)
+        if panel is None:
+            panel = self._panels[panel_id] = self.query_one(f"#{panel_id}", DetailPanel)
+        return panel
+
+    def _try_panel(self, panel_id: str) -> DetailPanel | None:
+        """Get a tab's detail panel by id, or None if it isn't composed."""
+        try:
+            return self._panel(panel_id)
+        except NoMatches:
+            return None
 
     def _get_outdated_count(self) -> int:
         """Get count of outdated homebrew packages."""
-        try:
-            tree = self.query_one("#brew-tree", EnvTree)
-            for entry in tree._entries:
-                if entry.details.get("type") == "outdated":
-                    return entry.details.get("count", 0)
-        except Exception:
-            pass
-        return 0
+        return self._outdated_count
 
     def _get_broken_count(self) -> int:
         """Get count of broken symlinks."""
-        try:
-            tree = self.query_one("#symlinks-tree", EnvTree)
-            total = 0
-            for entry in tree._entries:
-                total += entry.details.get("broken", 0)
-            return total
-        except Exception:
-            pass
-        return 0
+        return self._broken_count
 
     def _get_detected_python_sources(self) -> list:
         """Get list of detected Python environment sources."""
-        try:
-            tree = self.query_one("#python-tree", EnvTree)
-            detected = []
-            for entry in tree._entries:
-                env_type = entry.details.get("type", "")
-                if env_type == "conda":
-                    detected.append("Conda environments")
-                elif env_type == "pyenv":
-                    detected.append("pyenv versions")
-                elif env_type == "virtualenv":
-                    detected.append("virtualenv/venv")
-                elif env_type == "system":
-                    detected.append("System Python")
-                elif env_type == "homebrew":
-                    detected.append("Homebrew Python")
-            return list(set(detected))
-        except Exception:
-            pass
-        return []
+        return self._detected_python_sources
 
     def _get_asdf_plugins(self) -> list:
         """Get list of asdf plugins."""
-        try:
-            tree = self.query_one("#asdf-tree", EnvTree)
-            return [entry.details.get("plugin", "") for entry in tree._entries]
-        except Exception:
-            pass
-        return []
+        return self._asdf_plugins
+
+    def _get_node_manager(self) -> str:
+        """Get the Node.js version manager, detecting it on first use."""
+        if self._node_manager is None:
+            if not self._node_collector:
+                return "unknown"
+            self._node_manager = self._node_collector._detect_manager()
+        return self._node_manager
+
+    def _get_ruby_manager(self) -> str:
+        """Get the Ruby version manager, detecting it on first use."""
+        if self._ruby_manager is None:
+            if not self._ruby_collector:
+                return "unknown"
+            self._ruby_manager = self._ruby_collector._detect_manager()
+        return self._ruby_manager
+
+    def _repos(self) -> list[str]:
+        """Get cached git repository paths, loading them on first use."""
+        if self._repos_cache is None:
+            self._repos_cache, self._scan_dirs_cache = load_git_config()
+        return self._repos_cache
+
+    def _scan_dirs(self) -> list[str]:
+        """Get saved git scan directories, loading them on first use."""
+        if self._scan_dirs_cache is None:
+            self._repos_cache, self._scan_dirs_cache = load_git_config()
+        return self._scan_dirs_cache
+
+    def _invalidate_git_config(self) -> None:
+        """Drop the cached repos and scan dirs after the cache file changes."""
+        self._repos_cache = None
+        self._scan_dirs_cache = None
+
+    # Python env types in display order, with their welcome-panel labels
+    _PYTHON_SOURCES = (
+        ("conda", "Conda environments"),
+        ("pyenv", "pyenv versions"),
+        ("virtualenv", "virtualenv/venv"),
+        ("system", "System Python"),
+        ("homebrew", "Homebrew Python"),
+    )
+
+    def _update_aggregates(self, key: str, entries: list[EnvEntry]) -> None:
+        """Recompute the welcome-panel summaries for freshly loaded entries.
+
+        Done once per load so tab switches and root selections don't rescan
+        the tree.
+        """
+        if key == "brew":
+            self._outdated_count = next(
+                (
+                    e.details.get("count", 0)
+                    for e in entries
+                    if e.details.get("type") == "outdated"
+                ),
+                0,
+            )
+        elif key == "symlinks":
+            self._broken_count = sum(e.details.get("broken", 0) for e in entries)
+        elif key == "python":
+            seen = {e.details.get("type", "") for e in entries}
+            self._detected_python_sources = [
+                label for env_type, label in self._PYTHON_SOURCES if env_type in seen
+            ]
+        elif key == "asdf":
+            self._asdf_plugins = [e.details.get("plugin", "") for e in entries]
+        elif key == "shell":
+            self._shell_entries = entries
 
     def _load_shell_data(self) -> None:
         """Load shell config synchronously (it's fast)."""
         try:
-            tree = self.query_one("#shell-tree", EnvTree)
-            tree.set_entries(self._shell_collector.collect())
+            tree = self._tree("shell-tree")
+            entries = self._shell_collector.collect()
+            tree.set_entries(entries)
+            self._update_aggregates("shell", entries)
         except Exception as e:
             self.app.notify(f"Shell error: {e}", severity="error")
 
     def _load_path_data(self) -> None:
         """Load PATH data."""
-        try:
-            tree = self.query_one("#path-tree", EnvTree)
-            tree.set_entries(self._path_collector.collect())
-            tree.root.label = "PATH Search Order (c=collapse)"
-        except Exception as e:
-            self.app.notify(f"PATH error: {e}", severity="error")
+        self._start_collector("path")
 
     def _load_symlinks_data(self) -> None:
         """Load symlinks data."""
-        try:
-            tree = self.query_one("#symlinks-tree", EnvTree)
-            tree.set_entries(self._symlink_collector.collect())
-            tree.root.label = "Symlinks (c=collapse)"
-        except Exception as e:
-            self.app.notify(f"Symlinks error: {e}", severity="error")
+        self._start_collector("symlinks")
 
     def _load_brew_data(self) -> None:
         """Load Homebrew data - first from cache, then sync in background."""
         cache = get_brew_list_cache()
 
         # Try to load from cache for instant display
-        cached_formulae = cache.get(CacheKey.FORMULAE)
-        cached_casks = cache.get(CacheKey.CASKS)
-        cached_outdated = cache.get(CacheKey.OUTDATED)
+        cached = cache.get_many([CacheKey.FORMULAE, CacheKey.CASKS, CacheKey.OUTDATED])
+        cached_formulae = cached[CacheKey.FORMULAE]
+        cached_casks = cached[CacheKey.CASKS]
+        cached_outdated = cached[CacheKey.OUTDATED]
 
         if cached_formulae is not None:
             # Show cached data immediately
@@ -466,24 +595,41 @@ class MainScreen(Widget):
         self.run_worker(
             self._sync_brew_data_worker,
             name="brew_sync",
-            thread=True,
             exclusive=True,
+            # Failures are reported in on_worker_state_changed
+            exit_on_error=False,
         )
 
-    def _sync_brew_data_worker(self) -> BrewCollectResult:
-        """Worker thread: Fetch fresh brew data."""
-        return collect_all_sync(use_cache=False)
+    def _refresh_brew_async(self) -> None:
+        """Resync Homebrew data after a change, leaving all work to the worker."""
+        self._brew_loaded = False
+        if self._brew_syncing:
+            # The sync in flight may have listed packages before the change
+            self._brew_resync_pending = True
+        else:
+            self._start_brew_sync()
+
+    async def _sync_brew_data_worker(self) -> BrewCollectResult:
+        """Async worker: Fetch fresh brew data, running brew commands concurrently."""
+        return await collect_all_async()
 
     def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
         """Handle worker completion."""
-        if event.worker.name == "brew_sync":
+        if event.worker.name.startswith("load_"):
+            self._on_collector_done(event.worker.name[len("load_") :], event)
+        elif event.worker.name == "brew_sync":
             if event.state.name == "SUCCESS" and event.worker.result:
                 result = event.worker.result
                 entries = build_entries_from_result(result)
                 self._update_brew_tree(entries, from_cache=False)
             elif event.state.name == "ERROR":
                 self.app.notify("Failed to sync Homebrew data", severity="error")
-            self._brew_syncing = False
+            # PENDING/RUNNING also land here; only a finished sync frees the slot
+            if event.worker.is_finished:
+                self._brew_syncing = False
+                if self._brew_resync_pending:
+                    self._brew_resync_pending = False
+                    self._start_brew_sync()
         elif event.worker.name == "git_collect":
             if event.state.name == "SUCCESS" and event.worker.result:
                 self._update_git_tree(event.worker.result)
@@ -495,6 +641,7 @@ class MainScreen(Widget):
                 repos = event.worker.result
                 if repos:
                     add_repos(repos)
+                    self._invalidate_git_config()
                     self.app.notify(
                         f"Found {len(repos)} repositories", severity="information"
                     )
@@ -504,12 +651,27 @@ class MainScreen(Widget):
                     self.app.notify("No git repositories found", severity="warning")
             elif event.state.name == "ERROR":
                 self.app.notify("Failed to scan home directory", severity="error")
+        elif event.worker.name == "clipboard_copy":
+            # Clipboard failures stay silent, as they always have
+            if event.state.name == "SUCCESS":
+                self.app.notify(f"Copied: {event.worker.result}", timeout=2)
+        elif event.worker.name == "symlink_bulk_delete":
+            if event.state.name == "SUCCESS":
+                deleted, failed = event.worker.result
+                self.app.notify(
+                    f"Deleted {deleted}, failed {failed}", severity="information"
+                )
+                self._refresh_symlinks()
+            elif event.state.name == "ERROR":
+                self.app.notify(f"Error: {event.worker.error}", severity="error")
+                self._refresh_symlinks()
 
     def _update_brew_tree(self, entries: list, from_cache: bool) -> None:
         """Update the brew tree with entries."""
         try:
-            tree = self.query_one("#brew-tree", EnvTree)
+            tree = self._tree("brew-tree")
             tree.set_entries(entries)
+            self._update_aggregates("brew", entries)
 
             if from_cache:
                 tree.root.label = "Homebrew Packages (cached, syncing...)"
@@ -520,7 +682,7 @@ class MainScreen(Widget):
 
             # Update welcome panel
             try:
-                panel = self.query_one("#brew-detail", DetailPanel)
+                panel = self._panel("brew-detail")
                 outdated = self._get_outdated_count()
                 panel.show_homebrew_welcome(
                     outdated, loading=False, syncing=self._brew_syncing
@@ -529,13 +691,12 @@ class MainScreen(Widget):
                 pass
 
             # Start background loading of brew info for packages
-            package_names = []
-            for e in entries:
-                if e.details.get("type") == "category":
-                    package_names.extend(
-                        [p["name"] for p in e.details.get("packages", [])]
-                    )
-
+            package_names = (
+                p["name"]
+                for e in entries
+                if e.details.get("type") == "category"
+                for p in e.details.get("packages", ())
+            )
             get_brew_cache().load_all_in_background(package_names)
 
         except Exception as e:
@@ -543,81 +704,139 @@ class MainScreen(Widget):
 
     def _load_python_data(self) -> None:
         """Load Python data."""
-        try:
-            tree = self.query_one("#python-tree", EnvTree)
-            tree.set_entries(self._python_collector.collect())
-            tree.root.label = "Python Environments (c=collapse)"
-            self._python_loaded = True
-        except Exception as e:
-            self.app.notify(f"Python error: {e}", severity="error")
+        self._start_collector("python")
 
     def _load_node_data(self) -> None:
         """Load Node.js data."""
-        if not self._node_collector:
-            return
-        try:
-            tree = self.query_one("#node-tree", EnvTree)
-            tree.set_entries(self._node_collector.collect())
-            tree.root.label = "Node.js Versions (c=collapse)"
-            self._node_loaded = True
-        except Exception as e:
-            self.app.notify(f"Node error: {e}", severity="error")
+        self._start_collector("node")
 
     def _load_ruby_data(self) -> None:
         """Load Ruby data."""
-        if not self._ruby_collector:
-            return
-        try:
-            tree = self.query_one("#ruby-tree", EnvTree)
-            tree.set_entries(self._ruby_collector.collect())
-            tree.root.label = "Ruby Versions (c=collapse)"
-            self._ruby_loaded = True
-        except Exception as e:
-            self.app.notify(f"Ruby error: {e}", severity="error")
+        self._start_collector("ruby")
 
     def _load_rust_data(self) -> None:
         """Load Rust data."""
-        if not self._rust_collector:
-            return
-        try:
-            tree = self.query_one("#rust-tree", EnvTree)
-            tree.set_entries(self._rust_collector.collect())
-            tree.root.label = "Rust Toolchains (c=collapse)"
-            self._rust_loaded = True
-        except Exception as e:
-            self.app.notify(f"Rust error: {e}", severity="error")
+        self._start_collector("rust")
 
     def _load_asdf_data(self) -> None:
         """Load asdf data."""
-        if not self._asdf_collector:
-            return
-        try:
-            tree = self.query_one("#asdf-tree", EnvTree)
-            tree.set_entries(self._asdf_collector.collect())
-            tree.root.label = "asdf Plugins (c=collapse)"
-            self._asdf_loaded = True
-        except Exception as e:
-            self.app.notify(f"asdf error: {e}", severity="error")
+        self._start_collector("asdf")
 
     def _load_npm_data(self) -> None:
         """Load NPM data."""
+        self._start_collector("npm")
+
+    # Collectors run on worker threads: key -> (collector attribute, tree id,
+    # loaded root label, loaded flag or None, name used in error messages)
+    _COLLECTOR_JOBS = {
+        "shell": (
+            "_shell_collector",
+            "shell-tree",
+            "Shell Config Load Order (c=collapse)",
+            None,
+            "Shell",
+        ),
+        "path": (
+            "_path_collector",
+            "path-tree",
+            "PATH Search Order (c=collapse)",
+            None,
+            "PATH",
+        ),
+        "symlinks": (
+            "_symlink_collector",
+            "symlinks-tree",
+            "Symlinks (c=collapse)",
+            None,
+            "Symlinks",
+        ),
+        "python": (
+            "_python_collector",
+            "python-tree",
+            "Python Environments (c=collapse)",
+            "_python_loaded",
+            "Python",
+        ),
+        "node": (
+            "_node_collector",
+            "node-tree",
+            "Node.js Versions (c=collapse)",
+            "_node_loaded",
+            "Node",
+        ),
+        "ruby": (
+            "_ruby_collector",
+            "ruby-tree",
+            "Ruby Versions (c=collapse)",
+            "_ruby_loaded",
+            "Ruby",
+        ),
+        "rust": (
+            "_rust_collector",
+            "rust-tree",
+            "Rust Toolchains (c=collapse)",
+            "_rust_loaded",
+            "Rust",
+        ),
+        "asdf": (
+            "_asdf_collector",
+            "asdf-tree",
+            "asdf Plugins (c=collapse)",
+            "_asdf_loaded",
+            "asdf",
+        ),
+        "npm": (
+            "_npm_collector",
+            "npm-tree",
+            "NPM Packages (c=collapse)",
+            "_npm_loaded",
+            "NPM",
+        ),
+    }
+
+    def _start_collector(self, key: str) -> None:
+        """Start a collector on a worker thread; see _on_collector_done."""
+        collector = getattr(self, self._COLLECTOR_JOBS[key][0])
+        if collector is None:
+            return
+        # One group per collector so a reload supersedes only its own earlier run
+        self.run_worker(
+            collector.collect,
+            name=f"load_{key}",
+            group=f"load_{key}",
+            thread=True,
+            exclusive=True,
+            # Failures are reported by _on_collector_done, not fatal to the app
+            exit_on_error=False,
+        )
+
+    def _on_collector_done(self, key: str, event: Worker.StateChanged) -> None:
+        """Route a finished collector worker's entries to its tree."""
+        _, tree_id, label, loaded_flag, name = self._COLLECTOR_JOBS[key]
+        if event.state.name == "ERROR":
+            self.app.notify(f"{name} error: {event.worker.error}", severity="error")
+            return
+        if event.state.name != "SUCCESS":
+            return
         try:
-            tree = self.query_one("#npm-tree", EnvTree)
-            tree.set_entries(self._npm_collector.collect())
-            tree.root.label = "NPM Packages (c=collapse)"
-            self._npm_loaded = True
+            tree = self._tree(tree_id)
+            tree.set_entries(event.worker.result)
+            tree.root.label = label
+            self._update_aggregates(key, event.worker.result)
+            if loaded_flag:
+                setattr(self, loaded_flag, True)
         except Exception as e:
-            self.app.notify(f"NPM error: {e}", severity="error")
+            self.app.notify(f"{name} error: {e}", severity="error")
 
     def _load_git_data(self) -> None:
         """Load Git repository data using background worker."""
         if not self._git_collector:
             return
         try:
-            tree = self.query_one("#git-tree", EnvTree)
-            panel = self.query_one("#git-detail", DetailPanel)
-            repos = load_cached_repos()
-            scan_dirs = load_scan_dirs()
+            tree = self._tree("git-tree")
+            panel = self._panel("git-detail")
+            repos = self._repos()
+            scan_dirs = self._scan_dirs()
 
             # Show loading state if we have repos
             if repos:
@@ -647,9 +866,9 @@ class MainScreen(Widget):
     def _update_git_tree(self, result: GitCollectResult) -> None:
         """Update the git tree with collected data."""
         try:
-            tree = self.query_one("#git-tree", EnvTree)
-            panel = self.query_one("#git-detail", DetailPanel)
-            scan_dirs = load_scan_dirs()
+            tree = self._tree("git-tree")
+            panel = self._panel("git-detail")
+            scan_dirs = self._scan_dirs()
 
             tree.set_entries(result.entries)
             tree.root.label = "Git Repositories (c=collapse)"
@@ -663,6 +882,7 @@ class MainScreen(Widget):
         """Refresh all data."""
         # Invalidate brew caches on manual refresh
         get_brew_list_cache().invalidate_all()
+        self._invalidate_git_config()
 
         self._brew_loaded = False
         self._python_loaded = False
@@ -671,9 +891,9 @@ class MainScreen(Widget):
         self._ruby_loaded = False
         self._rust_loaded = False
         self._asdf_loaded = False
-        self._load_shell_data()
-        self._load_path_data()
-        self._load_symlinks_data()
+        # Core tabs reload on worker threads like the initial load
+        for key in ("shell", "path", "symlinks"):
+            self._start_collector(key)
 
         # Reload current tab if it's a slow one
         tabs = self.query_one("#main-tabs", TabbedContent)
@@ -704,226 +924,281 @@ class MainScreen(Widget):
             return
         self._handle_node_selection(event.node)
 
+    # tree id -> detail panel id
+    _PANEL_MAP = {
+        "path-tree": "path-detail",
+        "shell-tree": "shell-detail",
+        "brew-tree": "brew-detail",
+        "python-tree": "python-detail",
+        "symlinks-tree": "symlinks-detail",
+        "node-tree": "node-detail",
+        "ruby-tree": "ruby-detail",
+        "rust-tree": "rust-detail",
+        "asdf-tree": "asdf-detail",
+        "npm-tree": "npm-detail",
+        "git-tree": "git-detail",
+    }
+
+    # tree id -> welcome shown when its root or a childless node is selected
+    _ROOT_WELCOMES = {
+        "shell-tree": lambda s, p: p.show_shell_welcome(),
+        "path-tree": lambda s, p: p.show_path_welcome(),
+        "symlinks-tree": lambda s, p: p.show_symlinks_welcome(s._get_broken_count()),
+        "brew-tree": lambda s, p: p.show_homebrew_welcome(
+            s._get_outdated_count(), loading=not s._brew_loaded, syncing=s._brew_syncing
+        ),
+        "python-tree": lambda s, p: p.show_python_welcome(
+            s._get_detected_python_sources()
+        ),
+        "node-tree": lambda s, p: p.show_node_welcome(s._get_node_manager()),
+        "ruby-tree": lambda s, p: p.show_ruby_welcome(s._get_ruby_manager()),
+        "rust-tree": lambda s, p: p.show_rust_welcome(),
+        "asdf-tree": lambda s, p: p.show_asdf_welcome(s._get_asdf_plugins()),
+        "npm-tree": lambda s, p: p.show_npm_welcome(),
+        "git-tree": lambda s, p: (
+            p.show_git_welcome(len(s._repos())) if s._repos() else p.show_git_setup()
+        ),
+    }
+
     def _handle_node_selection(self, node) -> None:
         tree = node.tree
         tree_id = tree.id
 
-        panel_map = {
-            "path-tree": "path-detail",
-            "shell-tree": "shell-detail",
-            "brew-tree": "brew-detail",
-            "python-tree": "python-detail",
-            "symlinks-tree": "symlinks-detail",
-            "node-tree": "node-detail",
-            "ruby-tree": "ruby-detail",
-            "rust-tree": "rust-detail",
-            "asdf-tree": "asdf-detail",
-            "npm-tree": "npm-detail",
-            "git-tree": "git-detail",
-        }
-
-        panel_id = panel_map.get(tree_id)
+        panel_id = self._PANEL_MAP.get(tree_id)
         if not panel_id:
             return
 
-        try:
-            detail_panel = self.query_one(f"#{panel_id}", DetailPanel)
-        except Exception:
+        detail_panel = self._try_panel(panel_id)
+        if detail_panel is None:
             return
 
         node_data = node.data
 
+        # Highlight and select both land here; skip re-rendering an unchanged panel
+        state = (
+            None
+            if node_data is not None
+            else (
+                self._brew_loaded,
+                self._brew_syncing,
+                self._outdated_count,
+                self._broken_count,
+                tuple(self._detected_python_sources),
+                tuple(self._asdf_plugins),
+            )
+        )
+        if self._last_selection == (
+            tree_id,
+            node_data,
+            detail_panel.generation,
+            state,
+        ):
+            return
+        self._render_selection(node, tree_id, detail_panel)
+        self._last_selection = (tree_id, node_data, detail_panel.generation, state)
+
+    def _render_selection(self, node, tree_id: str, detail_panel: DetailPanel) -> None:
+        node_data = node.data
+        # Moving off an alias drops its pending clipboard copy
+        self._pending_clip = None
         if node_data is None:
             # Root node or childless node clicked - show welcome for that tab
-            if tree_id == "shell-tree":
-                detail_panel.show_shell_welcome()
-            elif tree_id == "path-tree":
-                detail_panel.show_path_welcome()
-            elif tree_id == "symlinks-tree":
-                broken = self._get_broken_count()
-                detail_panel.show_symlinks_welcome(broken)
-            elif tree_id == "brew-tree":
-                outdated = self._get_outdated_count()
-                detail_panel.show_homebrew_welcome(
-                    outdated, loading=not self._brew_loaded, syncing=self._brew_syncing
-                )
-            elif tree_id == "python-tree":
-                detected = self._get_detected_python_sources()
-                detail_panel.show_python_welcome(detected)
-            elif tree_id == "node-tree":
-                manager = (
-                    self._node_collector._detect_manager()
-                    if self._node_collector
-                    else "unknown"
-                )
-                detail_panel.show_node_welcome(manager)
-            elif tree_id == "ruby-tree":
-                manager = (
-                    self._ruby_collector._detect_manager()
-                    if self._ruby_collector
-                    else "unknown"
-                )
-                detail_panel.show_ruby_welcome(manager)
-            elif tree_id == "rust-tree":
-                detail_panel.show_rust_welcome()
-            elif tree_id == "asdf-tree":
-                plugins = self._get_asdf_plugins()
-                detail_panel.show_asdf_welcome(plugins)
-            elif tree_id == "npm-tree":
-                detail_panel.show_npm_welcome()
-            elif tree_id == "git-tree":
-                repos = load_cached_repos()
-                if repos:
-                    detail_panel.show_git_welcome(len(repos))
-                else:
-                    detail_panel.show_git_setup()
+            self._ROOT_WELCOMES[tree_id](self, detail_panel)
             return
 
-        if isinstance(node_data, dict):
-            if "executable" in node_data:
-                detail_panel.show_executable(node_data["executable"], node_data["path"])
-                return
-
-            # NPM package - check before "package" to avoid confusion with Homebrew
-            if "npm_package" in node_data:
-                detail_panel.show_npm_package(
-                    node_data["npm_package"],
-                    node_data.get("pkg_type", "global"),
-                    node_data.get("project_path", ""),
-                )
-                return
-
-            # Homebrew package
-            if "package" in node_data:
-                detail_panel.show_package(node_data["package"])
-                return
+        # Exact-type lookup first; only subclasses pay for isinstance checks
+        view = self._SELECTION_VIEWS.get(type(node_data))
+        if view is None:
+            view = next(
+                (
+                    v
+                    for t, v in self._SELECTION_VIEWS.items()
+                    if isinstance(node_data, t)
+                ),
+                None,
+            )
+        if view is not None and getattr(self, view)(detail_panel, tree_id, node_data):
+            return
 
-            if "outdated_packages" in node_data:
-                detail_panel.show_outdated_summary(node_data["outdated_packages"])
-                return
+        if node.parent and node.parent.data and isinstance(node.parent.data, EnvEntry):
+            detail_panel.show_entry(node.parent.data)
 
-            if "symlink" in node_data:
-                detail_panel.show_symlink(node_data["symlink"])
-                return
+    def _flush_clipboard(self) -> None:
+        """Copy the alias the selection settled on, off the UI thread."""
+        self._clipboard_timer = None
+        clip, self._pending_clip = self._pending_clip, None
+        if clip is None:
+            return
+        text, name = clip
+        self.run_worker(
+            lambda: self._copy_to_clipboard_worker(text, name),
+            name="clipboard_copy",
+            group="clipboard_copy",
+            thread=True,
+            exit_on_error=False,
+        )
 
-            if "broken_links" in node_data:
-                detail_panel.show_broken_summary(node_data["broken_links"])
-                return
+    def _copy_to_clipboard_worker(self, text: str, name: str) -> str:
+        """Worker thread: Copy text to the clipboard, return what was copied."""
+        pyperclip.copy(text)
+        return name
 
-            # Pip package
-            if "pip_package" in node_data:
-                detail_panel.show_pip_package(
-                    node_data["pip_package"],
-                    node_data.get("env_type", ""),
-                    node_data.get("env_path", ""),
-                    node_data.get("is_system", False),
-                )
-                return
+    # Node data type -> view; a view returns False to fall back to the parent
+    _SELECTION_VIEWS = {
+        dict: "_render_dict_selection",
+        EnvEntry: "_render_entry_selection",
+    }
 
-            # Node package
-            if "node_package" in node_data:
-                detail_panel.show_node_package(
-                    node_data["node_package"],
-                    node_data.get("manager", ""),
-                    node_data.get("node_path", ""),
-                )
-                return
+    def _render_dict_selection(
+        self, detail_panel: DetailPanel, tree_id: str, node_data: dict
+    ) -> bool:
+        # Leaf dicts carry exactly one discriminating key; shell items have none
+        for key in node_data:
+            handler = self._NODE_HANDLERS.get(key)
+            if handler is not None:
+                getattr(self, handler)(detail_panel, node_data)
+                return True
+
+        item = node_data.get("item")
+        item_type = node_data.get("type", "")
+
+        if item is None:
+            return False
+
+        if item_type == "function":
+            shell_file = node_data.get("shell_file", "")
+            detail_panel.show_function(item, shell_file)
+            return True
+
+        if item_type == "alias":
+            shell_file = node_data.get("shell_file", "")
+            # Copied once the selection settles, not on every arrow key
+            self._pending_clip = (f"alias {item.name}='{item.value}'", item.name)
+            if self._clipboard_timer is not None:
+                self._clipboard_timer.stop()
+            self._clipboard_timer = self.set_timer(0.3, self._flush_clipboard)
+            detail_panel.show_alias(item, shell_file)
+            return True
+
+        detail_panel.show_item(item, item_type)
+        return True
+
+    def _render_entry_selection(
+        self, detail_panel: DetailPanel, tree_id: str, node_data: EnvEntry
+    ) -> bool:
+        details = node_data.details
+
+        # Check for shell config file
+        if "items" in details and "load_order" in details:
+            detail_panel.show_shell_file_selected(node_data.path, node_data.name)
+            return True
+
+        # Category entries (brew/npm groups) render by their type
+        view = self._ENTRY_TYPE_VIEWS.get(details.get("type"))
+        # An outdated entry without a package list gets the generic view
+        if details.get("type") == "outdated" and "packages" not in details:
+            view = None
+        if view is not None:
+            view(self, detail_panel, tree_id, details)
+            return True
+
+        # Check for git repository
+        if "branch" in details:
+            detail_panel.show_git_repo(node_data)
+            return True
+
+        detail_panel.show_entry(node_data)
+        return True
+
+    # EnvEntry details["type"] -> view for category entries
+    _ENTRY_TYPE_VIEWS = {
+        # Outdated lists differ between npm and homebrew
+        "outdated": lambda s, p, tree_id, d: (
+            p.show_npm_outdated_summary(d["packages"])
+            if tree_id == "npm-tree"
+            else p.show_outdated_summary(d["packages"])
+        ),
+        "category": lambda s, p, tree_id, d: p.show_homebrew_welcome(
+            s._get_outdated_count(), loading=not s._brew_loaded
+        ),
+        "global": lambda s, p, tree_id, d: p.show_npm_welcome(),
+        "local": lambda s, p, tree_id, d: p.show_npm_welcome(),
+    }
 
-            # Ruby gem
-            if "gem" in node_data:
-                detail_panel.show_gem_package(
-                    node_data["gem"],
-                    node_data.get("manager", ""),
-                    node_data.get("ruby_path", ""),
-                )
-                return
+    # Node-data key -> handler for dict leaves built by EnvTree
+    _NODE_HANDLERS = {
+        "executable": "_show_executable_node",
+        "npm_package": "_show_npm_package_node",
+        "package": "_show_package_node",
+        "outdated_packages": "_show_outdated_node",
+        "symlink": "_show_symlink_node",
+        "broken_links": "_show_broken_links_node",
+        "pip_package": "_show_pip_package_node",
+        "node_package": "_show_node_package_node",
+        "gem": "_show_gem_node",
+        "crate": "_show_crate_node",
+        "asdf_version": "_show_asdf_version_node",
+        "git_repo": "_show_git_repo_node",
+    }
 
-            # Cargo crate
-            if "crate" in node_data:
-                detail_panel.show_cargo_package(
-                    node_data["crate"],
-                    node_data.get("toolchain", ""),
-                )
-                return
+    def _show_executable_node(self, panel: DetailPanel, data: dict) -> None:
+        panel.show_executable(data["executable"], data["path"])
 
-            # asdf version
-            if "asdf_version" in node_data:
-                detail_panel.show_asdf_version(
-                    node_data["asdf_version"],
-                    node_data.get("plugin", ""),
-                    node_data.get("is_current", False),
-                )
-                return
+    def _show_npm_package_node(self, panel: DetailPanel, data: dict) -> None:
+        panel.show_npm_package(
+            data["npm_package"],
+            data.get("pkg_type", "global"),
+            data.get("project_path", ""),
+        )
 
-            # Git repo child nodes (branch, status, sync info)
-            if "git_repo" in node_data:
-                detail_panel.show_git_repo(node_data["git_repo"])
-                return
+    def _show_package_node(self, panel: DetailPanel, data: dict) -> None:
+        # Homebrew package
+        panel.show_package(data["package"])
 
-            item = node_data.get("item")
-            item_type = node_data.get("type", "")
-
-            if item is not None:
-                if item_type == "function":
-                    shell_file = node_data.get("shell_file", "")
-                    detail_panel.show_function(item, shell_file)
-                    return
-
-                if item_type == "alias":
-                    shell_file = node_data.get("shell_file", "")
-                    try:
-                        alias_cmd = f"alias {item.name}='{item.value}'"
-                        pyperclip.copy(alias_cmd)
-                        self.app.notify(f"Copied: {item.name}", timeout=2)
-                    except Exception:
-                        pass
-                    detail_panel.show_alias(item, shell_file)
-                    return
-
-                detail_panel.show_item(item, item_type)
-                return
+    def _show_outdated_node(self, panel: DetailPanel, data: dict) -> None:
+        panel.show_outdated_summary(data["outdated_packages"])
 
-        if isinstance(node_data, EnvEntry):
-            details = node_data.details
+    def _show_symlink_node(self, panel: DetailPanel, data: dict) -> None:
+        panel.show_symlink(data["symlink"])
 
-            # Check for shell config file
-            if "items" in details and "load_order" in details:
-                detail_panel.show_shell_file_selected(node_data.path, node_data.name)
-                return
+    def _show_broken_links_node(self, panel: DetailPanel, data: dict) -> None:
+        panel.show_broken_summary(data["broken_links"])
 
-            # Check for outdated category (differentiate npm vs homebrew)
-            if details.get("type") == "outdated" and "packages" in details:
-                # Check which tree this is from
-                tree_id = node.tree.id if hasattr(node, "tree") else ""
-                if tree_id == "npm-tree":
-                    detail_panel.show_npm_outdated_summary(details["packages"])
-                else:
-                    detail_panel.show_outdated_summary(details["packages"])
-                return
+    def _show_pip_package_node(self, panel: DetailPanel, data: dict) -> None:
+        panel.show_pip_package(
+            data["pip_package"],
+            data.get("env_type", ""),
+            data.get("env_path", ""),
+            data.get("is_system", False),
+        )
 
-            # Check for homebrew category
-            if details.get("type") == "category":
-                outdated = self._get_outdated_count()
-                detail_panel.show_homebrew_welcome(
-                    outdated, loading=not self._brew_loaded
-                )
-                return
+    def _show_node_package_node(self, panel: DetailPanel, data: dict) -> None:
+        panel.show_node_package(
+            data["node_package"],
+            data.get("manager", ""),
+            data.get("node_path", ""),
+        )
 
-            # Check for NPM group (global/local)
-            if details.get("type") in ("global", "local"):
-                detail_panel.show_npm_welcome()
-                return
+    def _show_gem_node(self, panel: DetailPanel, data: dict) -> None:
+        panel.show_gem_package(
+            data["gem"],
+            data.get("manager", ""),
+            data.get("ruby_path", ""),
+        )
 
-            # Check for git repository
-            if "branch" in details:
-                detail_panel.show_git_repo(node_data)
-                return
+    def _show_crate_node(self, panel: DetailPanel, data: dict) -> None:
+        panel.show_cargo_package(data["crate"], data.get("toolchain", ""))
 
-            detail_panel.show_entry(node_data)
-            return
+    def _show_asdf_version_node(self, panel: DetailPanel, data: dict) -> None:
+        panel.show_asdf_version(
+            data["asdf_version"],
+            data.get("plugin", ""),
+            data.get("is_current", False),
+        )
 
-        if node.parent and node.parent.data and isinstance(node.parent.data, EnvEntry):
-            detail_panel.show_entry(node.parent.data)
+    def _show_git_repo_node(self, panel: DetailPanel, data: dict) -> None:
+        # Git repo child nodes (branch, status, sync info)
+        panel.show_git_repo(data["git_repo"])
 
     # Shell config editing handlers
     def on_detail_panel_save_alias(self, event: DetailPanel.SaveAlias) -> None:
@@ -945,7 +1220,7 @@ class MainScreen(Widget):
                 self.app.notify(f"Added alias: {event.name}", severity="information")
 
             # Refresh shell tree
-            self._refresh_shell_tree()
+            self._refresh_shell_tree(event.file_path)
         except Exception as e:
             self.app.notify(f"Error saving alias: {e}", severity="error")
 
@@ -954,7 +1229,7 @@ class MainScreen(Widget):
         try:
             shell_edit.delete_item(event.file_path, event.line_number, "alias")
             self.app.notify(f"Deleted alias: {event.name}", severity="information")
-            self._refresh_shell_tree()
+            self._refresh_shell_tree(event.file_path)
         except Exception as e:
             self.app.notify(f"Error deleting alias: {e}", severity="error")
 
@@ -978,7 +1253,7 @@ class MainScreen(Widget):
                 shell_edit.add_function(event.file_path, event.name, event.body)
                 self.app.notify(f"Added function: {event.name}", severity="information")
 
-            self._refresh_shell_tree()
+            self._refresh_shell_tree(event.file_path)
         except Exception as e:
             self.app.notify(f"Error saving function: {e}", severity="error")
 
@@ -991,17 +1266,45 @@ class MainScreen(Widget):
                 event.file_path, event.start_line, "function", event.end_line
             )
             self.app.notify(f"Deleted function: {event.name}", severity="information")
-            self._refresh_shell_tree()
+            self._refresh_shell_tree(event.file_path)
         except Exception as e:
             self.app.notify(f"Error deleting function: {e}", severity="error")
 
-    def _refresh_shell_tree(self) -> None:
-        """Refresh the shell config tree."""
+    def _refresh_shell_tree(self, changed_path: str | None = None) -> None:
+        """Refresh the shell tree shortly, reparsing only changed_path if given.
+
+        Edits made in quick succession are applied in one rebuild.
+        """
+        if not self._shell_refresh_paths:
+            self.set_timer(0.15, self._do_refresh_shell_tree)
+        self._shell_refresh_paths.add(changed_path)
+
+    def _do_refresh_shell_tree(self) -> None:
+        """Apply the pending shell tree refresh."""
+        paths, self._shell_refresh_paths = self._shell_refresh_paths, set()
         try:
-            tree = self.query_one("#shell-tree", EnvTree)
-            tree.set_entries(self._shell_collector.collect())
-        except Exception:
-            pass
+            tree = self._tree("shell-tree")
+        except NoMatches:
+            return
+        entries = self._shell_entries
+        indexes = {e.path: i for i, e in enumerate(entries)}
+        try:
+            if not paths <= indexes.keys():
+                entries = self._shell_collector.collect()
+            else:
+                entries = list(entries)
+                # Splice from the end so earlier indexes stay valid
+                for path in sorted(paths, key=indexes.__getitem__, reverse=True):
+                    index = indexes[path]
+                    load_order = entries[index].details.get("load_order", 0)
+                    entries[index : index + 1] = self._shell_collector.recollect_file(
+                        path, load_order
+                    )
+        except Exception as e:
+            self.app.notify(f"Error refreshing shell config: {e}", severity="error")
+            return
+        tree.set_entries(entries)
+        self._update_aggregates("shell", entries)
 
     # PIP uninstall handler
     def on_detail_panel_uninstall_pip_package(
@@ -1017,7 +1320,9 @@ class MainScreen(Widget):
             cmd.insert(-1, "--break-system-packages")
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            result = subprocess.run(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60
+            )
             if result.returncode == 0:
                 self.app.notify(f"Uninstalled {pkg}", severity="information")
                 self._python_loaded = False
@@ -1027,6 +1332,55 @@ class MainScreen(Widget):
         except Exception as e:
             self.app.notify(f"Error: {e}", severity="error")
 
+    # Streaming command output
+    def _spawn_streaming(
+        self,
+        cmd: list[str],
+        panel_id: str,
+        title: str,
+        done_title: str,
+        on_complete: Callable[[int], None],
+        display: str | None = None,
+    ) -> subprocess.Popen:
+        """Run a command, streaming its output live into a detail panel.
+
+        A worker thread pumps the output; once the command exits the panel
+        shows done_title with the full output and on_complete gets the exit
+        code.
+        """
+        # Resolved once per command and reused for every output chunk
+        panel = self._try_panel(panel_id)
+        if panel is not None:
+            panel.show_running_command(title, display or " ".join(cmd))
+
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        output: list[str] = []
+
+        def finish(ret: int) -> None:
+            if panel is not None:
+                panel.show_command_complete(done_title, ret == 0, "".join(output))
+            on_complete(ret)
+
+        def pump() -> None:
+            try:
+                for chunk in _iter_output(proc):
+                    self.app.call_from_thread(
+                        self._append_command_output, panel, output, chunk
+                    )
+            finally:
+                self.app.call_from_thread(finish, proc.wait())
+
+        self.run_worker(pump, thread=True, exit_on_error=False)
+        return proc
+
+    def _append_command_output(
+        self, panel: DetailPanel | None, output: list[str], chunk: str
+    ) -> None:
+        """Record a chunk of command output and show it in the panel."""
+        output.append(chunk)
+        if panel is not None:
+            panel.append_output(chunk)
+
     # NPM uninstall handler
     def on_detail_panel_uninstall_npm_package(
         self, event: DetailPanel.UninstallNpmPackage
@@ -1041,7 +1395,9 @@ class MainScreen(Widget):
         cmd.append(pkg)
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            result = subprocess.run(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60
+            )
             if result.returncode == 0:
                 self.app.notify(f"Uninstalled {pkg}", severity="information")
                 self._npm_loaded = False
@@ -1062,24 +1418,14 @@ class MainScreen(Widget):
 
     def _run_npm_upgrade_single(self, package_name: str) -> None:
         """Run npm install -g package@latest with live output."""
-        try:
-            panel = self.query_one("#npm-detail", DetailPanel)
-            panel.show_running_command(
-                f"Upgrading {package_name}", f"npm install -g {package_name}@latest"
-            )
-        except Exception:
-            pass
-
-        self._npm_process = subprocess.Popen(
+        self._npm_process = self._spawn_streaming(
             ["npm", "install", "-g", "--loglevel", "notice", f"{package_name}@latest"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
+            "npm-detail",
+            f"Upgrading {package_name}",
+            f"Upgrade {package_name}",
+            lambda ret: self._finish_npm(package_name, ret),
+            display=f"npm install -g {package_name}@latest",
         )
-        self._npm_output = []
-        self._npm_upgrading_package = package_name
-        self.set_timer(0.1, self._poll_npm_upgrade)
 
     def on_detail_panel_npm_upgrade_all(self, event: DetailPanel.NpmUpgradeAll) -> None:
         """Handle npm upgrade all request."""
@@ -1088,80 +1434,27 @@ class MainScreen(Widget):
 
     def _run_npm_upgrade_all(self) -> None:
         """Run npm update -g with live output."""
-        try:
-            panel = self.query_one("#npm-detail", DetailPanel)
-            panel.show_running_command("Upgrading Global NPM Packages", "npm update -g")
-        except Exception:
-            pass
-
-        self._npm_process = subprocess.Popen(
+        self._npm_process = self._spawn_streaming(
             ["npm", "update", "-g", "--loglevel", "notice"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
+            "npm-detail",
+            "Upgrading Global NPM Packages",
+            "Upgrade Global NPM Packages",
+            lambda ret: self._finish_npm(None, ret),
+            display="npm update -g",
         )
-        self._npm_output = []
-        self.set_timer(0.1, self._poll_npm_upgrade)
 
-    def _poll_npm_upgrade(self) -> None:
-        """Poll npm upgrade process for output."""
-        if not hasattr(self, "_npm_process") or self._npm_process is None:
-            return
-
-        import fcntl
-        import os
-
-        while True:
-            if self._npm_process.stdout is None:
-                break
-            try:
-                fd = self._npm_process.stdout.fileno()
-                fl = fcntl.fcntl(fd, fcntl.F_GETFL)
-                fcntl.fcntl(fd, fcntl.F_SETFL, fl | os.O_NONBLOCK)
-                line = self._npm_process.stdout.readline()
-                if line:
-                    self._npm_output.append(line)
-                    try:
-                        panel = self.query_one("#npm-detail", DetailPanel)
-                        panel.append_output(line)
-                    except Exception:
-                        pass
-                else:
-                    break
-            except (BlockingIOError, IOError):
-                break
-
-        ret = self._npm_process.poll()
-        if ret is None:
-            self.set_timer(0.2, self._poll_npm_upgrade)
+    def _finish_npm(self, pkg_name: str | None, ret: int) -> None:
+        """Report the finished npm upgrade and reload its data."""
+        if ret == 0:
+            msg = f"{pkg_name} upgraded!" if pkg_name else "All NPM packages upgraded!"
+            self.app.notify(msg, severity="information")
         else:
-            output = "".join(self._npm_output)
-            pkg_name = getattr(self, "_npm_upgrading_package", None)
-            title = f"Upgrade {pkg_name}" if pkg_name else "Upgrade Global NPM Packages"
-
-            try:
-                panel = self.query_one("#npm-detail", DetailPanel)
-                panel.show_command_complete(title, ret == 0, output)
-            except Exception:
-                pass
+            self.app.notify("NPM upgrade had errors", severity="warning")
 
-            if ret == 0:
-                msg = (
-                    f"{pkg_name} upgraded!"
-                    if pkg_name
-                    else "All NPM packages upgraded!"
-                )
-                self.app.notify(msg, severity="information")
-            else:
-                self.app.notify("NPM upgrade had errors", severity="warning")
-
-            self._npm_upgrading_package = None
-
-            # Refresh NPM data
-            self._npm_loaded = False
-            self._load_npm_data()
-            self._npm_process = None
+        # Refresh NPM data
+        self._npm_loaded = False
+        self._load_npm_data()
+        self._npm_process = None
 
     # Homebrew handlers
     def on_detail_panel_upgrade_package(
@@ -1170,23 +1463,39 @@ class MainScreen(Widget):
         """Handle package upgrade request."""
         pkg = event.package_name
         self.app.notify(f"Upgrading {pkg}...", timeout=3)
-        self.set_timer(0.1, lambda: self._run_upgrade(pkg))
+        if pkg not in self._brew_batch:
+            self._brew_batch.append(pkg)
+        self._schedule_brew_flush()
+
+    def _schedule_brew_flush(self) -> None:
+        """(Re)start the short wait that gathers upgrades into one brew run."""
+        if self._brew_flush_timer is not None:
+            self._brew_flush_timer.stop()
+        self._brew_flush_timer = self.set_timer(0.2, self._flush_brew_batch)
+
+    def _flush_brew_batch(self) -> None:
+        """Upgrade every queued package with a single brew invocation."""
+        packages, self._brew_batch = self._brew_batch, []
+        self._brew_flush_timer = None
+        if len(packages) == 1:
+            self._run_upgrade(packages[0])
+        elif packages:
+            self._run_brew_upgrade_batch(packages)
 
     def _run_upgrade(self, package_name: str) -> None:
         """Run brew upgrade in background."""
         try:
             result = subprocess.run(
                 ["brew", "upgrade", package_name],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=120,
             )
             if result.returncode == 0:
                 self.app.notify(f"Upgraded {package_name}!", severity="information")
                 # Invalidate caches for this package
                 get_brew_list_cache().invalidate_for_upgrade(package_name)
-                self._brew_loaded = False
-                self._load_brew_data()
+                self._refresh_brew_async()
             else:
                 self.app.notify(f"Failed to upgrade {package_name}", severity="error")
         except subprocess.TimeoutExpired:
@@ -1194,6 +1503,28 @@ class MainScreen(Widget):
         except Exception as e:
             self.app.notify(f"Error: {e}", severity="error")
 
+    def _run_brew_upgrade_batch(self, packages: list[str]) -> None:
+        """Run brew upgrade for several packages with live output."""
+        self._brew_process = self._spawn_streaming(
+            ["brew", "upgrade", *packages],
+            "brew-detail",
+            f"Upgrading {len(packages)} Packages",
+            f"Upgrade {len(packages)} Packages",
+            lambda ret: self._finish_brew_batch(packages, ret),
+        )
+
+    def _finish_brew_batch(self, packages: list[str], ret: int) -> None:
+        """Report the finished batch upgrade and reload its data."""
+        if ret == 0:
+            self.app.notify(f"Upgraded {', '.join(packages)}!", severity="information")
+        else:
+            self.app.notify("Upgrade had errors", severity="warning")
+
+        # Some packages may have upgraded even if brew reported errors
+        get_brew_list_cache().invalidate_for_upgrades(packages)
+        self._refresh_brew_async()
+        self._brew_process = None
+
     def on_detail_panel_brew_update(self, event: DetailPanel.BrewUpdate) -> None:
         """Handle brew update request."""
         self.app.notify("Running brew update...", timeout=3)
@@ -1201,74 +1532,25 @@ class MainScreen(Widget):
 
     def _run_brew_update(self) -> None:
         """Run brew update with live output."""
-        try:
-            panel = self.query_one("#brew-detail", DetailPanel)
-            panel.show_running_command("Updating Homebrew", "brew update")
-        except Exception:
-            pass
-
-        self._brew_update_process = subprocess.Popen(
+        self._brew_update_process = self._spawn_streaming(
             ["brew", "update"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
+            "brew-detail",
+            "Updating Homebrew",
+            "Update Homebrew",
+            self._finish_brew_update,
         )
-        self._brew_update_output = []
-        self.set_timer(0.1, self._poll_brew_update)
-
-    def _poll_brew_update(self) -> None:
-        """Poll brew update process for output."""
-        if (
-            not hasattr(self, "_brew_update_process")
-            or self._brew_update_process is None
-        ):
-            return
-
-        import fcntl
-        import os
-
-        while True:
-            if self._brew_update_process.stdout is None:
-                break
-            try:
-                fd = self._brew_update_process.stdout.fileno()
-                fl = fcntl.fcntl(fd, fcntl.F_GETFL)
-                fcntl.fcntl(fd, fcntl.F_SETFL, fl | os.O_NONBLOCK)
-                line = self._brew_update_process.stdout.readline()
-                if line:
-                    self._brew_update_output.append(line)
-                    try:
-                        panel = self.query_one("#brew-detail", DetailPanel)
-                        panel.append_output(line)
-                    except Exception:
-                        pass
-                else:
-                    break
-            except (BlockingIOError, IOError):
-                break
 
-        ret = self._brew_update_process.poll()
-        if ret is None:
-            self.set_timer(0.2, self._poll_brew_update)
+    def _finish_brew_update(self, ret: int) -> None:
+        """Report the finished brew update and reload its data."""
+        if ret == 0:
+            self.app.notify("Homebrew updated!", severity="information")
+            # Invalidate outdated cache since brew update changes available versions
+            get_brew_list_cache().invalidate_for_update()
         else:
-            output = "".join(self._brew_update_output)
-            try:
-                panel = self.query_one("#brew-detail", DetailPanel)
-                panel.show_command_complete("Update Homebrew", ret == 0, output)
-            except Exception:
-                pass
-
-            if ret == 0:
-                self.app.notify("Homebrew updated!", severity="information")
-                # Invalidate outdated cache since brew update changes available versions
-                get_brew_list_cache().invalidate_for_update()
-            else:
-                self.app.notify("Update had errors", severity="warning")
+            self.app.notify("Update had errors", severity="warning")
 
-            self._brew_loaded = False
-            self._load_brew_data()
-            self._brew_update_process = None
+        self._refresh_brew_async()
+        self._brew_update_process = None
 
     def on_detail_panel_brew_upgrade_all(
         self, event: DetailPanel.BrewUpgradeAll
@@ -1287,143 +1569,46 @@ class MainScreen(Widget):
 
     def _run_brew_uninstall(self, package_name: str) -> None:
         """Run brew uninstall with live output."""
-        try:
-            panel = self.query_one("#brew-detail", DetailPanel)
-            panel.show_running_command(
-                f"Uninstalling {package_name}", f"brew uninstall {package_name}"
-            )
-        except Exception:
-            pass
-
-        self._brew_process = subprocess.Popen(
+        self._brew_process = self._spawn_streaming(
             ["brew", "uninstall", package_name],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
+            "brew-detail",
+            f"Uninstalling {package_name}",
+            f"Uninstall {package_name}",
+            lambda ret: self._finish_brew_uninstall(package_name, ret),
         )
-        self._brew_output = []
-        self._brew_uninstalling = package_name
-        self.set_timer(0.1, self._poll_brew_uninstall)
-
-    def _poll_brew_uninstall(self) -> None:
-        """Poll brew uninstall process for output."""
-        if not hasattr(self, "_brew_process") or self._brew_process is None:
-            return
-
-        import fcntl
-        import os
 
-        while True:
-            if self._brew_process.stdout is None:
-                break
-            try:
-                fd = self._brew_process.stdout.fileno()
-                fl = fcntl.fcntl(fd, fcntl.F_GETFL)
-                fcntl.fcntl(fd, fcntl.F_SETFL, fl | os.O_NONBLOCK)
-                line = self._brew_process.stdout.readline()
-                if line:
-                    self._brew_output.append(line)
-                    try:
-                        panel = self.query_one("#brew-detail", DetailPanel)
-                        panel.append_output(line)
-                    except Exception:
-                        pass
-                else:
-                    break
-            except (BlockingIOError, IOError):
-                break
-
-        ret = self._brew_process.poll()
-        if ret is None:
-            self.set_timer(0.2, self._poll_brew_uninstall)
+    def _finish_brew_uninstall(self, pkg_name: str, ret: int) -> None:
+        """Report the finished brew uninstall and reload its data."""
+        if ret == 0:
+            self.app.notify(f"{pkg_name} uninstalled!", severity="information")
+            get_brew_list_cache().invalidate_all()
         else:
-            output = "".join(self._brew_output)
-            pkg_name = getattr(self, "_brew_uninstalling", "package")
-            try:
-                panel = self.query_one("#brew-detail", DetailPanel)
-                panel.show_command_complete(f"Uninstall {pkg_name}", ret == 0, output)
-            except Exception:
-                pass
+            self.app.notify("Uninstall had errors", severity="warning")
 
-            if ret == 0:
-                self.app.notify(f"{pkg_name} uninstalled!", severity="information")
-                get_brew_list_cache().invalidate_all()
-            else:
-                self.app.notify("Uninstall had errors", severity="warning")
-
-            self._brew_loaded = False
-            self._load_brew_data()
-            self._brew_process = None
-            self._brew_uninstalling = None
+        self._refresh_brew_async()
+        self._brew_process = None
 
     def _run_brew_upgrade_all(self) -> None:
         """Run brew upgrade with live output."""
-        try:
-            panel = self.query_one("#brew-detail", DetailPanel)
-            panel.show_running_command("Upgrading All Packages", "brew upgrade")
-        except Exception:
-            pass
-
-        self._brew_process = subprocess.Popen(
+        self._brew_process = self._spawn_streaming(
             ["brew", "upgrade"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
+            "brew-detail",
+            "Upgrading All Packages",
+            "Upgrade All Packages",
+            self._finish_brew_upgrade,
         )
-        self._brew_output = []
-        self.set_timer(0.1, self._poll_brew_upgrade)
-
-    def _poll_brew_upgrade(self) -> None:
-        """Poll brew upgrade process for output."""
-        if not hasattr(self, "_brew_process") or self._brew_process is None:
-            return
-
-        import fcntl
-        import os
-
-        while True:
-            if self._brew_process.stdout is None:
-                break
-            try:
-                fd = self._brew_process.stdout.fileno()
-                fl = fcntl.fcntl(fd, fcntl.F_GETFL)
-                fcntl.fcntl(fd, fcntl.F_SETFL, fl | os.O_NONBLOCK)
-                line = self._brew_process.stdout.readline()
-                if line:
-                    self._brew_output.append(line)
-                    try:
-                        panel = self.query_one("#brew-detail", DetailPanel)
-                        panel.append_output(line)
-                    except Exception:
-                        pass
-                else:
-                    break
-            except (BlockingIOError, IOError):
-                break
 
-        ret = self._brew_process.poll()
-        if ret is None:
-            self.set_timer(0.2, self._poll_brew_upgrade)
+    def _finish_brew_upgrade(self, ret: int) -> None:
+        """Report the finished brew upgrade and reload its data."""
+        if ret == 0:
+            self.app.notify("All packages upgraded!", severity="information")
+            # Invalidate all caches after upgrade all
+            get_brew_list_cache().invalidate_all()
         else:
-            output = "".join(self._brew_output)
-            try:
-                panel = self.query_one("#brew-detail", DetailPanel)
-                panel.show_command_complete("Upgrade All Packages", ret == 0, output)
-            except Exception:
-                pass
-
-            if ret == 0:
-                self.app.notify("All packages upgraded!", severity="information")
-                # Invalidate all caches after upgrade all
-                get_brew_list_cache().invalidate_all()
-            else:
-                self.app.notify("Upgrade had errors", severity="warning")
+            self.app.notify("Upgrade had errors", severity="warning")
 
-            self._brew_loaded = False
-            self._load_brew_data()
-            self._brew_process = None
+        self._refresh_brew_async()
+        self._brew_process = None
 
     # Symlink handlers
     def on_detail_panel_delete_symlink(self, event: DetailPanel.DeleteSymlink) -> None:
@@ -1434,18 +1619,18 @@ class MainScreen(Widget):
 
     def _try_delete_symlink(self, symlink_path: str) -> None:
         """Try to delete symlink, prompt for sudo if needed."""
-        import os
-
         try:
-            if os.path.islink(symlink_path):
-                os.unlink(symlink_path)
-                self.app.notify(f"Deleted {symlink_path}", severity="information")
-                self._refresh_symlinks()
-            else:
+            if not stat.S_ISLNK(os.lstat(symlink_path).st_mode):
                 self.app.notify(f"Not a symlink: {symlink_path}", severity="error")
+                return
+            os.unlink(symlink_path)
+            self.app.notify(f"Deleted {symlink_path}", severity="information")
+            self._refresh_symlinks()
+        except FileNotFoundError:
+            self.app.notify(f"Not a symlink: {symlink_path}", severity="error")
         except PermissionError:
             try:
-                panel = self.query_one("#symlinks-detail", DetailPanel)
+                panel = self._panel("symlinks-detail")
                 panel.show_password_prompt(f"Delete: {symlink_path}", "delete_one")
             except Exception:
                 self.app.notify("Permission denied", severity="error")
@@ -1453,12 +1638,26 @@ class MainScreen(Widget):
             self.app.notify(f"Error: {e}", severity="error")
 
     def _refresh_symlinks(self) -> None:
-        """Refresh symlinks tree."""
+        """Refresh the symlinks tree shortly, once for a burst of deletes."""
+        if self._symlinks_refresh_pending:
+            return
+        self._symlinks_refresh_pending = True
+        self.set_timer(0.15, self._do_refresh_symlinks)
+
+    def _do_refresh_symlinks(self) -> None:
+        """Apply the pending symlinks tree refresh."""
+        self._symlinks_refresh_pending = False
         try:
-            tree = self.query_one("#symlinks-tree", EnvTree)
-            tree.set_entries(self._symlink_collector.collect())
-        except Exception:
-            pass
+            tree = self._tree("symlinks-tree")
+        except NoMatches:
+            return
+        try:
+            entries = self._symlink_collector.collect()
+        except Exception as e:
+            self.app.notify(f"Error refreshing symlinks: {e}", severity="error")
+            return
+        tree.set_entries(entries)
+        self._update_aggregates("symlinks", entries)
 
     def on_detail_panel_delete_all_broken(
         self, event: DetailPanel.DeleteAllBroken
@@ -1470,7 +1669,7 @@ class MainScreen(Widget):
             return
         count = len(event.symlink_paths)
         try:
-            panel = self.query_one("#symlinks-detail", DetailPanel)
+            panel = self._panel("symlinks-detail")
             panel.show_password_prompt(f"Delete {count} broken symlinks", "delete_all")
         except Exception:
             self.app.notify("Could not show password prompt", severity="error")
@@ -1509,26 +1708,56 @@ class MainScreen(Widget):
 
     def _run_bulk_sudo_delete(self, paths: list, password: str) -> None:
         """Delete multiple symlinks using sudo."""
-        deleted = 0
-        failed = 0
-        for path in paths:
-            try:
-                proc = subprocess.Popen(
-                    ["sudo", "-S", "rm", path],
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
+        self.run_worker(
+            lambda: self._bulk_sudo_delete_worker(paths, password),
+            name="symlink_bulk_delete",
+            thread=True,
+            exclusive=True,
+            exit_on_error=False,
+        )
+
+    def _bulk_sudo_delete_worker(self, paths: list, password: str) -> tuple[int, int]:
+        """Worker thread: Remove every path with one sudo rm, return counts."""
+        if not paths:
+            return 0, 0
+        timeout = max(10, len(paths) * 0.05)
+        try:
+            # Authenticate once up front; a wrong password fails before any rm
+            auth = subprocess.run(
+                ["sudo", "-S", "-v"],
+                input=password + "\n",
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                timeout=10,
+            )
+            if auth.returncode != 0:
+                return 0, len(paths)
+            proc = subprocess.run(
+                ["sudo", "-n", "rm", "--", *paths],
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+            if proc.returncode != 0 and "password is required" in proc.stderr:
+                # sudo is set not to cache credentials; send the password again
+                proc = subprocess.run(
+                    ["sudo", "-S", "rm", "--", *paths],
+                    input=password + "\n",
+                    capture_output=True,
                     text=True,
+                    timeout=timeout,
                 )
-                stdout, stderr = proc.communicate(input=password + "\n", timeout=10)
-                if proc.returncode == 0:
-                    deleted += 1
-                else:
-                    failed += 1
-            except Exception:
-                failed += 1
-        self.app.notify(f"Deleted {deleted}, failed {failed}", severity="information")
-        self._refresh_symlinks()
+        except subprocess.TimeoutExpired:
+            return 0, len(paths)
+        if proc.returncode == 0:
+            return len(paths), 0
+        # rm keeps going past failures and reports each one on its own line;
+        # no such lines means sudo itself refused (e.g. a wrong password)
+        failed = sum(1 for line in proc.stderr.splitlines() if line.startswith("rm:"))
+        if not failed:
+            failed = len(paths)
+        return len(paths) - failed, failed
 
     # Git handlers
     def on_detail_panel_git_add_path(self, event: DetailPanel.GitAddPath) -> None:
@@ -1546,6 +1775,7 @@ class MainScreen(Widget):
             add_repos(repos)
             # Save the scan directory for future reference
             add_scan_dir(path)
+            self._invalidate_git_config()
             self.app.notify(f"Found {len(repos)} repositories", severity="information")
             self._git_loaded = False
             self._load_git_data()
@@ -1573,12 +1803,14 @@ class MainScreen(Widget):
     def on_detail_panel_git_remove_repo(self, event: DetailPanel.GitRemoveRepo) -> None:
         """Handle removing a repo from the list."""
         remove_git_repo(event.path)
+        self._invalidate_git_config()
         self.app.notify(f"Removed {event.path}", severity="information")
         self._git_loaded = False
         self._load_git_data()
 
     def on_detail_panel_git_refresh(self, event: DetailPanel.GitRefresh) -> None:
         """Handle git refresh request."""
+        self._invalidate_git_config()
         self._git_loaded = False
         self._load_git_data()
         self.app.notify("Refreshed", timeout=1)
@@ -1588,11 +1820,12 @@ class MainScreen(Widget):
     ) -> None:
         """Handle removing a scan directory."""
         remove_scan_dir(event.path)
+        self._invalidate_git_config()
         # Refresh the panel to show updated scan dirs
         try:
-            panel = self.query_one("#git-detail", DetailPanel)
-            repos = load_cached_repos()
-            scan_dirs = load_scan_dirs()
+            panel = self._panel("git-detail")
+            repos = self._repos()
+            scan_dirs = self._scan_dirs()
             panel.show_git_welcome(len(repos), scan_dirs)
         except Exception:
             pass
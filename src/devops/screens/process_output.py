@@ -0,0 +1,42 @@
+"""Line splitting for output streamed from a subprocess pipe."""
+
+import codecs
+import io
+
+# Longest unterminated line held back before it is emitted as-is
+MAX_PARTIAL_LINE = 65536
+
+
+class OutputLines:
+    """Turn raw pipe reads into complete, decoded lines.
+
+    Like a text-mode pipe, "\\r" and "\\r\\n" count as line endings, so
+    carriage-return progress updates (ffmpeg's frame/time line) come
+    through as they are written instead of piling up until the next
+    "\\n". A partial line longer than MAX_PARTIAL_LINE is emitted as-is,
+    so memory stays bounded however long a process writes without a
+    newline.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True
+        )
+        self._partial = ""
+
+    def feed(self, data: bytes) -> list[str]:
+        """Return the lines completed by data, each ending in a newline."""
+        text = self._partial + self._decoder.decode(data)
+        *lines, self._partial = text.split("\n")
+        lines = [line + "\n" for line in lines]
+        if len(self._partial) > MAX_PARTIAL_LINE:
+            lines.append(self._partial)
+            self._partial = ""
+        return lines
+
+    def close(self) -> list[str]:
+        """Return whatever is left once the pipe reaches EOF."""
+        text = self._partial + self._decoder.decode(b"", final=True)
+        *lines, last = text.split("\n")
+        self._partial = ""
+        return [line + "\n" for line in lines] + ([last] if last else [])
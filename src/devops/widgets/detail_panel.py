@@ -197,6 +197,15 @@ class DetailPanel(VerticalScroll):
         # Git state
         self._current_git_repo = None
         self._scan_dirs = []
+        # Bumped whenever the panel content is replaced
+        self._generation = 0
+        # Text of the running command view that append_output extends
+        self._output_text: Text | None = None
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped whenever the panel content is replaced."""
+        return self._generation
 
     def compose(self):
         yield self._content
@@ -235,6 +244,8 @@ class DetailPanel(VerticalScroll):
             if widget is not self._content:
                 widget.remove()
         self._awaiting_password = False
+        self._generation += 1
+        self._output_text = None
 
     # Welcome pages
     def show_path_welcome(self) -> None:
@@ -1122,6 +1133,7 @@ class DetailPanel(VerticalScroll):
             )
 
     def show_password_prompt(self, message: str, action: str) -> None:
+        self._generation += 1
         self._awaiting_password = True
         self._password_action = action
 
@@ -1163,18 +1175,16 @@ class DetailPanel(VerticalScroll):
         content.append("Output:\n", style="bold")
         content.append("-" * 40 + "\n", style="dim")
         self._content.update(content)
+        self._output_text = content
         self._shown_welcome = True
 
     def append_output(self, text: str) -> None:
-        current = self._content.renderable
-        if isinstance(current, Text):
-            current.append(text)
-            self._content.update(current)
-        else:
-            new_content = Text(str(current))
-            new_content.append(text)
-            self._content.update(new_content)
-        self._content.refresh()
+        # Only the running command view takes output; once the user has moved
+        # to another view the text is kept for show_command_complete instead
+        if self._output_text is None:
+            return
+        self._output_text.append(text)
+        self._content.update(self._output_text)
         self.refresh()
         self.scroll_end(animate=False)
 
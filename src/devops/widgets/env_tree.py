@@ -1,5 +1,8 @@
 """Tree widget for displaying environment entries."""
 
+from collections.abc import Iterator
+from time import monotonic
+
 import pyperclip
 from rich.text import Text
 from textual.message import Message
@@ -22,9 +25,13 @@ class EnvTree(Tree):
         ("c", "collapse_all", "Collapse All"),
     ]
 
+    # Seconds of node building per frame before yielding to the event loop
+    BUILD_BUDGET = 0.008
+
     def __init__(self, label: str = "Environment", **kwargs):
         super().__init__(label, **kwargs)
         self._entries: list[EnvEntry] = []
+        self._builder: Iterator[None] | None = None
         self.show_root = True
         self.guide_depth = 4
         self.root.allow_expand = False
@@ -44,74 +51,98 @@ class EnvTree(Tree):
 
     def _rebuild_tree(self) -> None:
         self.clear()
+        self.root.expand()
+        self.root.allow_expand = False
+        self._builder = self._iter_build()
+        self._continue_build(self._builder)
 
+    def _iter_build(self) -> Iterator[None]:
         for entry in self._entries:
-            label = self._create_label(entry)
-            node = self.root.add(label, data=entry)
-
-            details = entry.details
-
-            # Shell config items
-            if "items" in details:
-                self._add_shell_config_children(node, entry)
-            # PATH entries
-            elif "search_order" in details:
-                self._add_path_children(node, entry)
-            # NPM packages (check before Homebrew to avoid "packages" key collision)
-            elif (
-                details.get("type") in ("global", "local", "outdated")
-                and "packages" in details
-                and entry.path in ("npm global", "npm outdated")
-            ):
-                self._add_npm_children(node, entry)
-            # Homebrew packages
-            elif "packages" in details and details.get("type") in (
-                "outdated",
-                "category",
-                None,
-            ):
-                self._add_package_children(
-                    node, details["packages"], details.get("type")
-                )
-            # Symlinks
-            elif "symlinks" in details:
-                self._add_symlink_children(node, details)
-            # Version managers (old style)
-            elif "versions" in details and "manager" not in details:
-                self._add_version_children(node, details)
-            elif "plugins" in details:
-                self._add_plugin_children(node, details)
-            # Python envs with pip packages
-            elif details.get("type") in (
-                "conda",
-                "pyenv",
-                "virtualenv",
-                "system",
-                "homebrew",
-            ):
-                self._add_python_children(node, entry)
-            # Node.js versions with packages
-            elif (
-                "manager" in details
-                and details.get("packages") is not None
-                and "gem_count" not in details
-            ):
-                self._add_node_children(node, entry)
-            # Ruby versions with gems
-            elif "gems" in details:
-                self._add_ruby_children(node, entry)
-            # Rust toolchains with crates
-            elif "crates" in details:
-                self._add_rust_children(node, entry)
-            # asdf plugins with versions
-            elif "plugin" in details and "versions" in details:
-                self._add_asdf_children(node, entry)
-            # Git repositories
-            elif "branch" in details:
-                self._add_git_children(node, entry)
+            yield from self._add_entry(entry)
+
+    def _continue_build(self, builder: Iterator[None]) -> None:
+        """Advance the tree build, yielding to the event loop between batches.
+
+        Large result sets (thousands of PATH executables, hundreds of
+        formulae in one Homebrew category) would otherwise be built in one
+        blocking pass. The builder yields after every node it adds, so once
+        a batch exceeds BUILD_BUDGET the rest - including the remaining
+        children of a large entry - is continued after the next refresh.
+        """
+        if builder is not self._builder:
+            return  # Superseded by a newer set_entries
+        deadline = monotonic() + self.BUILD_BUDGET
+        for _ in builder:
+            if monotonic() > deadline:
+                self.call_after_refresh(self._continue_build, builder)
+                return
+        self._builder = None
+
+    def _add_entry(self, entry: EnvEntry) -> Iterator[None]:
+        label = self._create_label(entry)
+        node = self.root.add(label, data=entry)
 
-        self.root.expand()
-        self.root.allow_expand = False
+        details = entry.details
+
+        # Shell config items
+        if "items" in details:
+            self._add_shell_config_children(node, entry)
+        # PATH entries
+        elif "search_order" in details:
+            yield from self._add_path_children(node, entry)
+        # NPM packages (check before Homebrew to avoid "packages" key collision)
+        elif (
+            details.get("type") in ("global", "local", "outdated")
+            and "packages" in details
+            and entry.path in ("npm global", "npm outdated")
+        ):
+            yield from self._add_npm_children(node, entry)
+        # Homebrew packages
+        elif "packages" in details and details.get("type") in (
+            "outdated",
+            "category",
+            None,
+        ):
+            yield from self._add_package_children(
+                node, details["packages"], details.get("type")
+            )
+        # Symlinks
+        elif "symlinks" in details:
+            self._add_symlink_children(node, details)
+        # Version managers (old style)
+        elif "versions" in details and "manager" not in details:
+            self._add_version_children(node, details)
+        elif "plugins" in details:
+            self._add_plugin_children(node, details)
+        # Python envs with pip packages
+        elif details.get("type") in (
+            "conda",
+            "pyenv",
+            "virtualenv",
+            "system",
+            "homebrew",
+        ):
+            self._add_python_children(node, entry)
+        # Node.js versions with packages
+        elif (
+            "manager" in details
+            and details.get("packages") is not None
+            and "gem_count" not in details
+        ):
+            self._add_node_children(node, entry)
+        # Ruby versions with gems
+        elif "gems" in details:
+            self._add_ruby_children(node, entry)
+        # Rust toolchains with crates
+        elif "crates" in details:
+            self._add_rust_children(node, entry)
+        # asdf plugins with versions
+        elif "plugin" in details and "versions" in details:
+            self._add_asdf_children(node, entry)
+        # Git repositories
+        elif "branch" in details:
+            self._add_git_children(node, entry)
+        yield
 
     def _add_shell_config_children(self, node, entry: EnvEntry) -> None:
         items = entry.details.get("items", {})
@@ -167,7 +198,7 @@ class EnvTree(Tree):
                         },
                     )
 
-    def _add_path_children(self, node, entry: EnvEntry) -> None:
+    def _add_path_children(self, node, entry: EnvEntry) -> Iterator[None]:
         details = entry.details
 
         if details.get("exists") and details.get("all_executables"):
@@ -175,6 +206,7 @@ class EnvTree(Tree):
             for exe in execs:
                 exe_text = Text(f"  {exe}", style="dim")
                 node.add_leaf(exe_text, data={"executable": exe, "path": entry.path})
+                yield
 
         if details.get("issue"):
             issue = Text(f"⚠ {details['issue']}", style="bold yellow")
@@ -183,7 +215,9 @@ class EnvTree(Tree):
                 fix = Text(f"→ {details['fix_suggestion']}", style="italic yellow")
                 node.add_leaf(fix)
 
-    def _add_package_children(self, node, packages: list, pkg_type: str = None) -> None:
+    def _add_package_children(
+        self, node, packages: list, pkg_type: str = None
+    ) -> Iterator[None]:
         for pkg in packages:
             name = pkg.get("name", str(pkg))
             version = pkg.get("version", "")
@@ -197,6 +231,7 @@ class EnvTree(Tree):
                 pkg_text.append(f" - {desc}", style="dim italic")
 
             node.add_leaf(pkg_text, data={"package": pkg})
+            yield
 
     def _add_symlink_children(self, node, details: dict) -> None:
         broken = details.get("broken_links", [])
@@ -391,7 +426,7 @@ class EnvTree(Tree):
                 },
             )
 
-    def _add_npm_children(self, node, entry: EnvEntry) -> None:
+    def _add_npm_children(self, node, entry: EnvEntry) -> Iterator[None]:
         """Add NPM package children."""
         details = entry.details
         pkg_type = details.get("type", "global")
@@ -413,6 +448,7 @@ class EnvTree(Tree):
                     "project_path": project_path,
                 },
             )
+            yield
 
     def _add_git_children(self, node, entry: EnvEntry) -> None:
         """Add Git repository status children."""
@@ -0,0 +1,38 @@
+"""Run and Copy must use the form as it is, not the last debounced preview."""
+
+import asyncio
+
+import pyperclip
+from textual.app import App
+
+from devops.screens.ffmpeg import FFmpegScreen
+from devops.screens.imagemagick import ImageMagickScreen
+
+
+def _copy_right_after_edit(screen_cls, monkeypatch) -> str:
+    """Edit the input path and press Copy before the preview timer fires."""
+    copied = []
+    monkeypatch.setattr(pyperclip, "copy", copied.append)
+
+    class _App(App):
+        def compose(self):
+            yield screen_cls()
+
+    async def run() -> None:
+        app = _App()
+        async with app.run_test(size=(160, 60)) as pilot:
+            screen = app.query_one(screen_cls)
+            await pilot.pause()
+            screen.query_one("#input-file").value = "/tmp/fresh.mov"
+            screen._copy_command()
+
+    asyncio.run(run())
+    return copied[0]
+
+
+def test_ffmpeg_copy_flushes_pending_preview(monkeypatch):
+    assert "/tmp/fresh.mov" in _copy_right_after_edit(FFmpegScreen, monkeypatch)
+
+
+def test_imagemagick_copy_flushes_pending_preview(monkeypatch):
+    assert "/tmp/fresh.mov" in _copy_right_after_edit(ImageMagickScreen, monkeypatch)
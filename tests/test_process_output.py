@@ -0,0 +1,27 @@
+"""Splitting streamed process output into lines."""
+
+from devops.screens.process_output import MAX_PARTIAL_LINE, OutputLines
+
+
+def test_carriage_return_progress_lines_arrive_as_written():
+    lines = OutputLines()
+    assert lines.feed(b"frame=  1 fps=0.0\r") == []
+    # The "\r" is only known to end a line once the next byte isn't "\n"
+    assert lines.feed(b"frame=  2 fps=30\r") == ["frame=  1 fps=0.0\n"]
+    assert lines.feed(b"\nDone") == ["frame=  2 fps=30\n"]
+    assert lines.close() == ["Done"]
+
+
+def test_multibyte_characters_split_across_reads():
+    lines = OutputLines()
+    data = "naïve\n".encode()
+    assert lines.feed(data[:3]) == []
+    assert lines.feed(data[3:]) == ["naïve\n"]
+    assert lines.close() == []
+
+
+def test_unterminated_output_is_emitted_once_over_the_cap():
+    lines = OutputLines()
+    assert lines.feed(b"x" * MAX_PARTIAL_LINE) == []
+    assert lines.feed(b"x") == ["x" * (MAX_PARTIAL_LINE + 1)]
+    assert lines.close() == []
@@ -0,0 +1,57 @@
+"""Clearing a Select must never leave a blank value in the command preview."""
+
+import asyncio
+
+import pytest
+from textual.app import App
+from textual.widgets import Checkbox, Select
+from textual.widgets._select import InvalidSelectValueError
+
+from devops.screens.ffmpeg import FFmpegScreen
+from devops.screens.imagemagick import ImageMagickScreen
+
+
+def _clear_each_select(screen_cls, toggles: tuple[str, ...]) -> list[str]:
+    """Enable every option group, try to clear each Select, return the command."""
+
+    class _App(App):
+        def compose(self):
+            yield screen_cls()
+
+    async def run() -> list[str]:
+        app = _App()
+        async with app.run_test(size=(160, 60)) as pilot:
+            screen = app.query_one(screen_cls)
+            screen.query_one("#input-file").value = "/tmp/example.mov"
+            for toggle_id in toggles:
+                screen.query_one(f"#{toggle_id}", Checkbox).value = True
+            await pilot.pause()
+
+            for select in screen.query(Select):
+                before = select.value
+                with pytest.raises(InvalidSelectValueError):
+                    select.clear()
+                assert select.value == before
+                # Let the debounced preview rebuild run
+                await pilot.pause(0.3)
+
+            return list(screen._current_command)
+
+    return asyncio.run(run())
+
+
+def test_ffmpeg_preview_survives_cleared_selects():
+    cmd = _clear_each_select(
+        FFmpegScreen, ("toggle-convert", "toggle-compress", "toggle-resize")
+    )
+    assert all(isinstance(arg, str) for arg in cmd)
+    assert "-crf" in cmd and "-preset" in cmd
+
+
+def test_imagemagick_preview_survives_cleared_selects():
+    cmd = _clear_each_select(
+        ImageMagickScreen,
+        ("toggle-convert", "toggle-resize", "toggle-crop", "toggle-rotate"),
+    )
+    assert all(isinstance(arg, str) for arg in cmd)
+    assert "-resize" in cmd